@@ -1,16 +1,37 @@
 import sys
+import math
 import time
+import random
 import logging
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QPushButton, QLabel, QHBoxLayout, QLineEdit, QTableWidget,
-    QDialog, QFormLayout, QGraphicsScene, QGraphicsView, QMenu, QComboBox, QGraphicsItem
+    QDialog, QFormLayout, QGraphicsScene, QGraphicsView, QMenu, QComboBox, QGraphicsItem, QSpinBox,
+    QTableWidgetItem, QStyledItemDelegate, QFileDialog, QMessageBox
 )
-from PyQt6.QtGui import QPainter, QColor, QPen, QFont, QBrush, QFontMetrics, QIcon 
+from PyQt6.QtGui import QPainter, QColor, QPen, QFont, QBrush, QFontMetrics, QIcon, QPixmap, QImage
 from PyQt6.QtCore import Qt, QRectF, QPointF, QTimer
 
+from map_coloring_csp import (
+    MapColoringCSP, GraphColoringProblem, NQueensProblem, BUILTIN_MAPS, load_map, load_builtin_map,
+    generate_random_planar_map, min_conflicts_search
+)
+
 logging.basicConfig(level=logging.DEBUG, format='%(asctime)s - %(levelname)s - %(message)s')
 
+MAX_GRID_SIZE = 100
+MIN_CELL_SIZE = 24
+MAP_COLORS = ["red", "green", "blue", "yellow", "orange", "purple", "brown", "white", "black"]
+MAX_DRAWN_MAP_NODES = 2000
+MAX_DRAWN_QUEENS = 100
+MAX_LOCAL_SEARCH_VARIABLES = 100000
+
 class ColorCell(QGraphicsItem):
+    # paint resources shared by every cell of the same size: (border pen, font, metrics),
+    # keyed by the cell size rounded to whole pixels
+    paint_resources = {}
+    # pre-rendered color name labels keyed by (text, rounded cell size)
+    text_pixmaps = {}
+    
     def __init__(self, color_name, colors_list, parent_window, i, j, cell_size, parent=None):
         super().__init__(parent)
         self.original_color_name = color_name
@@ -22,31 +43,54 @@ class ColorCell(QGraphicsItem):
         self.i = i
         self.j = j
         self.cell_size = cell_size
-        self.toggle_state = False
-        self.timer = QTimer()
-        self.timer.timeout.connect(self.toggle_flash_color) 
         self.setFlag(QGraphicsItem.GraphicsItemFlag.ItemIsSelectable, True)
         self.setAcceptedMouseButtons(Qt.MouseButton.LeftButton)
         self.setAcceptHoverEvents(True)
+        # keep the painted cell as a pixmap; it is only redrawn after update()
+        self.setCacheMode(QGraphicsItem.CacheMode.DeviceCoordinateCache)
+        
+    @classmethod
+    def get_paint_resources(cls, cell_size):
+        cell_size = round(cell_size)
+        resources = cls.paint_resources.get(cell_size)
+        if resources is None:
+            pen = QPen(Qt.GlobalColor.black, 1.5)
+            font = QFont("Segoe UI", max(1, int(cell_size * 0.2)), QFont.Weight.Medium)
+            resources = (pen, font, QFontMetrics(font))
+            cls.paint_resources[cell_size] = resources
+        return resources
+    
+    @classmethod
+    def get_text_pixmap(cls, text, cell_size):
+        key = (text, round(cell_size))
+        pixmap = cls.text_pixmaps.get(key)
+        if pixmap is None:
+            _, font, metrics = cls.get_paint_resources(cell_size)
+            pixmap = QPixmap(max(1, metrics.horizontalAdvance(text)), max(1, metrics.height()))
+            pixmap.fill(Qt.GlobalColor.transparent)
+            text_painter = QPainter(pixmap)
+            text_painter.setRenderHint(QPainter.RenderHint.TextAntialiasing)
+            text_painter.setPen(Qt.GlobalColor.black)
+            text_painter.setFont(font)
+            text_painter.drawText(0, metrics.ascent(), text)
+            text_painter.end()
+            cls.text_pixmaps[key] = pixmap
+        return pixmap
         
     def boundingRect(self):
         return QRectF(-self.cell_size / 2, -self.cell_size / 2, self.cell_size, self.cell_size)
         
     def paint(self, painter, option, widget=None):
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-        pen = QPen(Qt.GlobalColor.black, 1.5)
+        # antialiasing is already enabled on the view, no need to set it per cell
+        pen, _, metrics = self.get_paint_resources(self.cell_size)
         painter.setPen(pen)
         painter.setBrush(self.display_color)
         rect = self.boundingRect()
         painter.drawRoundedRect(rect, 10, 10)
             
-        display_text = self.selected_color_name or ""
-        painter.setPen(Qt.GlobalColor.black)
-        font = QFont("Segoe UI", int(self.cell_size * 0.2), QFont.Weight.Medium)
-        painter.setFont(font)
-        metrics = QFontMetrics(font)
-        text_width = metrics.horizontalAdvance(display_text)
-        painter.drawText(QPointF(-text_width / 2, 5), display_text)
+        if self.selected_color_name:
+            pixmap = self.get_text_pixmap(self.selected_color_name, self.cell_size)
+            painter.drawPixmap(QPointF(-pixmap.width() / 2, 5 - metrics.ascent()), pixmap)
             
     def mousePressEvent(self, event):
         if event.button() == Qt.MouseButton.LeftButton:
@@ -67,31 +111,15 @@ class ColorCell(QGraphicsItem):
         self.update()
         self.parent_window.update_cell(self.i, self.j, color_name)
             
-    def evaluate_match(self, correct_color):
-        if self.selected_color_name == correct_color:
-            self.display_color = QColor(self.get_color_rgb(self.original_color_name))    
-            self.update()
-            self.stop_flash()
-        else:
-            self.start_flash()
-                
-    def start_flash(self):
-        if not self.timer.isActive():
-            self.toggle_state = False
-            self.timer.start(500)
-
-    def stop_flash(self):
-        if self.timer.isActive():
-            self.timer.stop()
-            self.display_color = QColor(self.get_color_rgb(self.original_color_name))
-            self.update()
+    def restore_color(self):
+        self.display_color = QColor(self.get_color_rgb(self.original_color_name))
+        self.update()
                 
-    def toggle_flash_color(self):
-        if self.toggle_state:
+    def toggle_flash_color(self, toggle_state):
+        if toggle_state:
             self.display_color = QColor("red")
         else:
             self.display_color = QColor("green")
-        self.toggle_state = not self.toggle_state
         self.update()
             
     def get_color_rgb(self, color_name):
@@ -125,7 +153,18 @@ class ColorMatchingWindow(QMainWindow):
         self.colors = []
         self.init_colors = []
         self.user_grid = []
-        self.cells = []
+        self.score = 0
+        self.violations = set()
+        self.cells = {}  # (i, j) -> ColorCell, created only when scrolled into view
+        self.cell_size = 0
+        self.cell_spacing = 10
+        self.grid_origin = QPointF(0, 0)
+        
+        # one timer flashes every mismatched cell instead of a QTimer per cell
+        self.flashing_cells = set()
+        self.flash_toggle_state = False
+        self.flash_timer = QTimer(self)
+        self.flash_timer.timeout.connect(self.toggle_flashing_cells)
     
         self.setStyleSheet("""
             QLabel#HeaderLabel {
@@ -174,9 +213,15 @@ class ColorMatchingWindow(QMainWindow):
         self.admin_btn.clicked.connect(self.show_admin_dialog)
         layout.addWidget(self.admin_btn)
         
+        self.map_btn = QPushButton("Map Coloring")
+        self.map_btn.clicked.connect(self.show_map_dialog)
+        layout.addWidget(self.map_btn)
+        
         self.scene = QGraphicsScene()
         self.view = QGraphicsView(self.scene)
         self.view.setRenderHint(QPainter.RenderHint.Antialiasing)
+        self.view.horizontalScrollBar().valueChanged.connect(self.create_visible_cells)
+        self.view.verticalScrollBar().valueChanged.connect(self.create_visible_cells)
         layout.addWidget(self.view)
         
         button_layout = QHBoxLayout()
@@ -214,61 +259,141 @@ class ColorMatchingWindow(QMainWindow):
             self.clear_btn.setEnabled(True)
             self.new_game_btn.setEnabled(True)
         
+    def show_map_dialog(self):
+        dialog = MapColoringDialog(self)
+        dialog.exec()
+        
     def generate_game(self):
         if not self.init_colors:
             return
         self.scene.clear()
+        self.cells = {}
+        # the cell size changes with the view, so drop resources for earlier sizes
+        ColorCell.paint_resources.clear()
+        ColorCell.text_pixmaps.clear()
         view_width = self.view.viewport().width()
         view_height = self.view.viewport().height()
         available_size = min(view_width, view_height)
-        spacing = 10
+        spacing = 10 if self.size <= 10 else 2
         total_spacing = spacing * (self.size + 1)
-        cell_size = (available_size - total_spacing) / self.size
+        cell_size = max(MIN_CELL_SIZE, (available_size - total_spacing) / self.size)
         
+        # large grids no longer fit the view, so the scene grows and the view scrolls
         total_grid_width = self.size * (cell_size + spacing)
         total_grid_height = self.size * (cell_size + spacing)
-        x_offset = (view_width - total_grid_width) / 2 + cell_size / 2
-        y_offset = (view_height - total_grid_height) / 2 + cell_size / 2 
+        scene_width = max(view_width, total_grid_width + spacing)
+        scene_height = max(view_height, total_grid_height + spacing)
+        x_offset = (scene_width - total_grid_width) / 2 + cell_size / 2
+        y_offset = (scene_height - total_grid_height) / 2 + cell_size / 2 
         
-        self.cells = [[None for _ in range(self.size)] for _ in range(self.size)]
-        for i in range(self.size):
-            for j in range(self.size):
-                cell = ColorCell(self.init_colors[i][j], self.colors, self, i, j, cell_size)
-                x = j * (cell_size + spacing) + x_offset
-                y = i * (cell_size + spacing) + y_offset
-                cell.setPos(x, y)
-                self.scene.addItem(cell)
-                self.cells[i][j] = cell
-                self.user_grid[i][j] = None
-        self.scene.setSceneRect(0, 0, view_width, view_height)
+        self.cell_size = cell_size
+        self.cell_spacing = spacing
+        self.grid_origin = QPointF(x_offset, y_offset)
+        self.scene.setSceneRect(0, 0, scene_width, scene_height)
+        self.create_visible_cells()
+        
+    def create_visible_cells(self):
+        if not self.init_colors or not self.cell_size:
+            return
+        visible = self.view.mapToScene(self.view.viewport().rect()).boundingRect()
+        step = self.cell_size + self.cell_spacing
+        left = self.grid_origin.x() - self.cell_size / 2
+        top = self.grid_origin.y() - self.cell_size / 2
+        first_col = max(0, int((visible.left() - left) // step))
+        last_col = min(self.size - 1, int((visible.right() - left) // step))
+        first_row = max(0, int((visible.top() - top) // step))
+        last_row = min(self.size - 1, int((visible.bottom() - top) // step))
+        for i in range(first_row, last_row + 1):
+            for j in range(first_col, last_col + 1):
+                if (i, j) not in self.cells:
+                    self.create_cell(i, j)
+                    
+    def create_cell(self, i, j):
+        step = self.cell_size + self.cell_spacing
+        cell = ColorCell(self.init_colors[i][j], self.colors, self, i, j, self.cell_size)
+        cell.selected_color_name = self.user_grid[i][j]
+        if (i, j) in self.flashing_cells:
+            cell.toggle_flash_color(self.flash_toggle_state)
+        cell.setPos(j * step + self.grid_origin.x(), i * step + self.grid_origin.y())
+        self.scene.addItem(cell)
+        self.cells[(i, j)] = cell
+        return cell
+    
+    def start_cell_flash(self, i, j):
+        if (i, j) in self.flashing_cells:
+            return
+        self.flashing_cells.add((i, j))
+        if not self.flash_timer.isActive():
+            self.flash_toggle_state = False
+            self.flash_timer.start(500)
+            
+    def stop_cell_flash(self, i, j):
+        if (i, j) not in self.flashing_cells:
+            return
+        self.flashing_cells.discard((i, j))
+        cell = self.cells.get((i, j))
+        if cell:
+            cell.restore_color()
+        if not self.flashing_cells:
+            self.flash_timer.stop()
+            
+    def toggle_flashing_cells(self):
+        self.flash_toggle_state = not self.flash_toggle_state
+        for position in self.flashing_cells:
+            cell = self.cells.get(position)
+            if cell:
+                cell.toggle_flash_color(self.flash_toggle_state)
+    
+    def reset_scoring(self):
+        # nothing is picked yet, so every cell starts out as a violation
+        self.score = 0
+        self.violations = {(i, j) for i in range(self.size) for j in range(self.size)}
     
     def update_cell(self, i, j, selected_color_name):
+        correct_color = self.init_colors[i][j]
+        was_match = self.user_grid[i][j] == correct_color
         self.user_grid[i][j] = selected_color_name
+        is_match = selected_color_name == correct_color
+        if is_match and not was_match:
+            self.score += 1
+            self.violations.discard((i, j))
+        elif was_match and not is_match:
+            self.score -= 1
+            self.violations.add((i, j))
+        self.update_status()
+        
+    def update_status(self):
+        total = self.size * self.size
+        if self.violations:
+            state = f"❌ {len(self.violations)} cell(s) still inconsistent"
+        else:
+            state = "✔️ Consistent"
+        self.status_label.setText(f"Score: {self.score} / {total} - {state}")
         
     def clear_grid(self):
+        self.flash_timer.stop()
+        self.flashing_cells.clear()
+        for cell in self.cells.values():
+            cell.selected_color_name = None
+            cell.restore_color()
         for i in range(self.size):
             for j in range(self.size):
-                cell = self.cells[i][j]
-                cell.selected_color_name = None
-                cell.display_color = QColor(cell.get_color_rgb(cell.original_color_name))
-                cell.stop_flash()
-                cell.update()
                 self.user_grid[i][j] = None
+        self.reset_scoring()
         self.status_label.setText("Grid cleared. Click cells to select colors.")
         
     def new_game(self):
         self.show_admin_dialog()
     
     def check_csp(self):
-        consistent = True
-        for i in range(self.size):
-            for j in range(self.size):
-                cell = self.cells[i][j]
-                correct_color = self.init_colors[i][j]
-                if cell.selected_color_name != correct_color:
-                    consistent = False
-                cell.evaluate_match(correct_color)
-        score = sum(1 for i in range(self.size) for j in range(self.size) if self.user_grid[i][j] == self.init_colors[i][j]) 
+        # score and violations are kept up to date by update_cell, so only the cells whose
+        # flashing state changes are touched here
+        consistent = not self.violations
+        score = self.score
+        for i, j in self.flashing_cells - self.violations:
+            self.stop_cell_flash(i, j)
+        for i, j in self.violations:
+            self.start_cell_flash(i, j)
         
         result_dialog = QDialog(self)
         result_dialog.setWindowTitle("CSP Matching Result")
@@ -287,6 +412,24 @@ class ColorMatchingWindow(QMainWindow):
         result_layout.addWidget(close_button)
         result_dialog.exec()
         
+class ColorComboDelegate(QStyledItemDelegate):
+    # the combo box editor only exists while a cell is being edited, so a 100x100 table
+    # does not create 10,000 combo box widgets up front
+    def __init__(self, colors_provider, parent=None):
+        super().__init__(parent)
+        self.colors_provider = colors_provider
+        
+    def createEditor(self, parent, option, index):
+        combo = QComboBox(parent)
+        combo.addItems(self.colors_provider())
+        return combo
+    
+    def setEditorData(self, editor, index):
+        editor.setCurrentText(index.data() or "")
+        
+    def setModelData(self, editor, model, index):
+        model.setData(index, editor.currentText())
+
 class AdminDialog(QDialog):
     def __init__(self, colors, parent=None):
         super().__init__(parent)
@@ -297,41 +440,278 @@ class AdminDialog(QDialog):
         form = QFormLayout()
         self.colors_input = QLineEdit(",".join(colors))
         form.addRow("Colors (comma-separated):", self.colors_input)
+        self.size_spin = QSpinBox()
+        self.size_spin.setRange(1, MAX_GRID_SIZE)
+        self.size_spin.setValue(parent.size if parent else 3)
+        self.size_spin.valueChanged.connect(self.resize_grid)
+        form.addRow("Grid size (N x N):", self.size_spin)
         layout.addLayout(form)
         
-        self.init_grid = QTableWidget(3, 3)
-        self.init_grid.setHorizontalHeaderLabels(["0", "1", "2"])
-        self.init_grid.setVerticalHeaderLabels(["0", "1", "2"])
-        for i in range(3):
-            for j in range(3):
-                combo = QComboBox()
-                combo.addItems(colors)
-                self.init_grid.setCellWidget(i, j, combo)
+        self.init_grid = QTableWidget(0, 0)
+        self.init_grid.setItemDelegate(ColorComboDelegate(self.get_colors, self.init_grid))
+        self.resize_grid(self.size_spin.value())
         layout.addWidget(self.init_grid)
         
+        self.random_button = QPushButton("Randomize")
+        self.random_button.clicked.connect(self.randomize_grid)
+        layout.addWidget(self.random_button)
+        
         self.save_button = QPushButton("Save")
         self.save_button.clicked.connect(self.save_and_generate)
         layout.addWidget(self.save_button)
         
+    def get_colors(self):
+        return [c.strip() for c in self.colors_input.text().split(",") if c.strip()]
+        
+    def resize_grid(self, size):
+        colors = self.get_colors()
+        default_color = colors[0] if colors else "white"
+        old_size = self.init_grid.rowCount()
+        self.init_grid.setRowCount(size)
+        self.init_grid.setColumnCount(size)
+        self.init_grid.setHorizontalHeaderLabels([str(i) for i in range(size)])
+        self.init_grid.setVerticalHeaderLabels([str(i) for i in range(size)])
+        for i in range(size):
+            for j in range(size):
+                if i >= old_size or j >= old_size:
+                    self.init_grid.setItem(i, j, QTableWidgetItem(default_color))
+                    
+    def randomize_grid(self):
+        colors = self.get_colors()
+        if not colors:
+            return
+        size = self.init_grid.rowCount()
+        for i in range(size):
+            for j in range(size):
+                self.init_grid.item(i, j).setText(random.choice(colors))
+        
     def save_and_generate(self):
         self.parent.size, self.parent.colors, self.parent.init_colors = self.get_data()
         self.parent.user_grid = [[None for _ in range(self.parent.size)] for _ in range(self.parent.size)]
+        self.parent.reset_scoring()
+        self.parent.flash_timer.stop()
+        self.parent.flashing_cells.clear()
         self.parent.generate_game()
         self.accept()
         
     def get_data(self):
-        size = 3
-        colors = [c.strip() for c in self.colors_input.text().split(",") if c.strip()]
+        size = self.size_spin.value()
+        colors = self.get_colors()
         init_colors = []
         for i in range(size):
             row = []
             for j in range(size):
-                combo = self.init_grid.cellWidget(i, j)
-                color = combo.currentText()
+                color = self.init_grid.item(i, j).text()
                 row.append(color if color in colors else "white")
             init_colors.append(row)
         return size, colors, init_colors
 
+class MapColoringDialog(QDialog):
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("Map Coloring CSP")
+        self.resize(800, 700)
+        self.map_name = None
+        self.adjacency = {}
+        self.positions = {}
+        self.queens = None
+
+        layout = QVBoxLayout(self)
+        form = QFormLayout()
+        self.source_combo = QComboBox()
+        self.source_combo.addItems(list(BUILTIN_MAPS) + ["Random planar graph", "N-Queens", "Load JSON file..."])
+        form.addRow("Map:", self.source_combo)
+        self.nodes_spin = QSpinBox()
+        self.nodes_spin.setRange(10, MAX_LOCAL_SEARCH_VARIABLES)
+        self.nodes_spin.setValue(1000)
+        form.addRow("Random graph nodes / queens:", self.nodes_spin)
+        self.colors_spin = QSpinBox()
+        self.colors_spin.setRange(1, len(MAP_COLORS))
+        self.colors_spin.setValue(4)
+        form.addRow("Number of colors:", self.colors_spin)
+        self.solver_combo = QComboBox()
+        self.solver_combo.addItems(["Complete search (DSATUR + backtracking)", "Min-conflicts + tabu (large maps)"])
+        form.addRow("Solver:", self.solver_combo)
+        layout.addLayout(form)
+        
+        button_layout = QHBoxLayout()
+        self.load_button = QPushButton("Load Map")
+        self.load_button.clicked.connect(self.load_selected_map)
+        self.solve_button = QPushButton("Solve")
+        self.solve_button.clicked.connect(self.solve_map)
+        button_layout.addWidget(self.load_button)
+        button_layout.addWidget(self.solve_button)
+        layout.addLayout(button_layout)
+        
+        self.scene = QGraphicsScene()
+        self.view = QGraphicsView(self.scene)
+        self.view.setRenderHint(QPainter.RenderHint.Antialiasing)
+        layout.addWidget(self.view)
+        
+        self.result_label = QLabel("Load a map, then press Solve.")
+        self.result_label.setWordWrap(True)
+        layout.addWidget(self.result_label)
+        
+    def load_selected_map(self):
+        source = self.source_combo.currentText()
+        self.queens = None
+        try:
+            if source == "N-Queens":
+                self.queens = self.nodes_spin.value()
+                self.map_name, self.adjacency, self.positions = f"{self.queens}-Queens", {}, {}
+                self.result_label.setText(f"Loaded {self.map_name}: {self.queens} queens on a {self.queens}x{self.queens} board.")
+                self.draw_queens()
+                return True
+            if source in BUILTIN_MAPS:
+                self.map_name, self.adjacency, self.positions = load_builtin_map(source)
+            elif source == "Random planar graph":
+                self.map_name, self.adjacency, self.positions = generate_random_planar_map(self.nodes_spin.value())
+            else:
+                path, _ = QFileDialog.getOpenFileName(self, "Open Map", "", "JSON Files (*.json)")
+                if not path:
+                    return False
+                self.map_name, self.adjacency, self.positions = load_map(path)
+        except (OSError, ValueError) as e:
+            QMessageBox.warning(self, "Map Error", f"Could not load map: {e}")
+            return False
+        edge_count = sum(len(neighbors) for neighbors in self.adjacency.values()) // 2
+        self.result_label.setText(f"Loaded {self.map_name}: {len(self.adjacency)} regions, {edge_count} borders.")
+        self.draw_map()
+        return True
+        
+    def solve_map(self):
+        if not self.adjacency and not self.queens and not self.load_selected_map():
+            return
+        if self.queens:
+            self.solve_queens()
+            return
+        if self.solver_combo.currentIndex() == 1:
+            result = min_conflicts_search(GraphColoringProblem(self.adjacency, self.colors_spin.value()),
+                                          max_steps=50 * len(self.adjacency))
+            result["backtracks"] = 0
+            result["colors_used"] = len(set(result["assignment"].values()))
+            result["method"] += f" ({result['steps']} steps, {result['restarts']} restarts)"
+        else:
+            csp = MapColoringCSP(self.adjacency, self.colors_spin.value())
+            result = csp.solve()
+        logging.debug(f"Solved {self.map_name} with {result['method']} in {result['seconds']:.4f}s")
+        state = "✔️ Solved" if result["solved"] else f"❌ {result['conflicts']} conflicting border(s) left"
+        self.result_label.setText(
+            f"{self.map_name}: {state} | Method: {result['method']} | "
+            f"Time: {result['seconds'] * 1000:.1f} ms | Backtracks: {result['backtracks']} | "
+            f"Colors used: {result['colors_used']} / {self.colors_spin.value()}"
+        )
+        self.draw_map(result["assignment"])
+        
+    def solve_queens(self):
+        # N-queens is only practical with local search, so the solver choice is ignored here
+        result = min_conflicts_search(NQueensProblem(self.queens), max_steps=50 * self.queens)
+        logging.debug(f"Solved {self.map_name} with {result['method']} in {result['seconds']:.4f}s")
+        state = "✔️ Solved" if result["solved"] else f"❌ {result['conflicts']} attacking pair(s) left"
+        self.result_label.setText(
+            f"{self.map_name}: {state} | Method: {result['method']} | "
+            f"Time: {result['seconds'] * 1000:.1f} ms | Steps: {result['steps']} | Restarts: {result['restarts']}"
+        )
+        self.draw_queens(result["assignment"])
+        
+    def draw_queens(self, assignment=None):
+        self.scene.clear()
+        if self.queens > MAX_DRAWN_QUEENS:
+            self.scene.addText(f"{self.queens} queens - too many to draw, see the summary below.")
+            return
+        square = max(6, 600 // self.queens)
+        light, dark = QBrush(QColor("#F0D9B5")), QBrush(QColor("#B58863"))
+        no_pen = QPen(Qt.PenStyle.NoPen)
+        for row in range(self.queens):
+            for col in range(self.queens):
+                self.scene.addRect(col * square, row * square, square, square, no_pen,
+                                   light if (row + col) % 2 == 0 else dark)
+        for col, row in (assignment or {}).items():
+            self.scene.addEllipse(col * square + square * 0.2, row * square + square * 0.2, square * 0.6, square * 0.6,
+                                  QPen(Qt.GlobalColor.black, 1), QBrush(Qt.GlobalColor.red))
+        
+    def draw_map(self, assignment=None):
+        self.scene.clear()
+        if len(self.adjacency) > MAX_DRAWN_MAP_NODES:
+            self.scene.addText(f"{len(self.adjacency)} regions - too many to draw, see the summary below.")
+            return
+        
+        nodes = list(self.adjacency)
+        if self.positions and all(node in self.positions for node in nodes):
+            xs = [self.positions[node][0] for node in nodes]
+            ys = [self.positions[node][1] for node in nodes]
+            scale = 600 / max(max(xs) - min(xs), max(ys) - min(ys), 1e-9)
+            points = {node: QPointF((self.positions[node][0] - min(xs)) * scale,
+                                    (max(ys) - self.positions[node][1]) * scale) for node in nodes}
+        else:
+            # no coordinates in the file, so lay the regions out on a circle
+            points = {node: QPointF(300 + 280 * math.cos(2 * math.pi * k / len(nodes)),
+                                    300 + 280 * math.sin(2 * math.pi * k / len(nodes)))
+                      for k, node in enumerate(nodes)}
+                
+        radius = 14 if len(nodes) <= 100 else 4
+        edge_pen = QPen(QColor("#999999"), 1)
+        for node in nodes:
+            for neighbor in self.adjacency[node]:
+                if node < neighbor:
+                    self.scene.addLine(points[node].x(), points[node].y(),
+                                       points[neighbor].x(), points[neighbor].y(), edge_pen)
+        for node in nodes:
+            color = QColor("#ADD8E6")
+            if assignment and node in assignment:
+                color = QColor(MAP_COLORS[assignment[node]])
+            ellipse = self.scene.addEllipse(points[node].x() - radius, points[node].y() - radius,
+                                            2 * radius, 2 * radius, QPen(Qt.GlobalColor.black, 1), QBrush(color))
+            ellipse.setToolTip(node)
+            if len(nodes) <= 100:
+                label = self.scene.addText(node)
+                label.setPos(points[node].x() + radius, points[node].y() - radius)
+
+def benchmark_paint(size=MAX_GRID_SIZE, frames=10):
+    # paints every cell of a size x size grid off screen and reports the average frame time,
+    # then times a real view repaint, where the item pixmap cache applies
+    app = QApplication.instance() or QApplication(sys.argv)
+    logging.getLogger().setLevel(logging.INFO)
+    colors = ["red", "orange", "yellow", "green", "blue", "purple", "black", "white", "brown"]
+    window = ColorMatchingWindow()
+    window.size = size
+    window.colors = colors
+    window.init_colors = [[random.choice(colors) for _ in range(size)] for _ in range(size)]
+    window.user_grid = [[random.choice(colors) for _ in range(size)] for _ in range(size)]
+    window.generate_game()
+    for i in range(size):
+        for j in range(size):
+            if (i, j) not in window.cells:
+                window.create_cell(i, j)
+    cells = list(window.cells.values())
+    
+    image = QImage(int(window.cell_size * 2), int(window.cell_size * 2), QImage.Format.Format_ARGB32_Premultiplied)
+    for label in ("static", "flashing"):
+        if label == "flashing":
+            window.flashing_cells = set(window.cells)
+        timings = []
+        for _ in range(frames):
+            if label == "flashing":
+                window.toggle_flashing_cells()
+            painter = QPainter(image)
+            painter.translate(window.cell_size, window.cell_size)
+            start = time.perf_counter()
+            for cell in cells:
+                cell.paint(painter, None)
+            timings.append(time.perf_counter() - start)
+            painter.end()
+        print(f"{size}x{size} grid, {label} paint(): {sum(timings) / len(timings) * 1000:.1f} ms/frame")
+        
+    window.flashing_cells.clear()
+    window.show()
+    app.processEvents()
+    timings = []
+    for _ in range(frames):
+        start = time.perf_counter()
+        window.view.viewport().grab()
+        timings.append(time.perf_counter() - start)
+    print(f"{size}x{size} grid, cached view repaint: {sum(timings) / len(timings) * 1000:.1f} ms/frame")
+
 def main():
     app = QApplication(sys.argv)
     window = ColorMatchingWindow()
@@ -339,4 +719,7 @@ def main():
     sys.exit(app.exec())
     
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    if "--benchmark" in sys.argv:
+        benchmark_paint()
+    else:
+        main()
\ No newline at end of file
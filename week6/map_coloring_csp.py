@@ -0,0 +1,447 @@
+import os
+import json
+import time
+import heapq
+import random
+
+MAPS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "maps")
+BUILTIN_MAPS = {
+    "Cambodia provinces": "cambodia_provinces.json",
+    "US states": "us_states.json",
+}
+
+def load_map(path):
+    # JSON layout: {"name": ..., "adjacency": {node: [neighbors]}, "positions": {node: [x, y]}}
+    # positions are optional; adjacency is made symmetric so one-sided lists are fine
+    with open(path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    if "adjacency" not in data:
+        raise ValueError(f"{path} has no 'adjacency' section")
+    adjacency = {str(node): set() for node in data["adjacency"]}
+    for node, neighbors in data["adjacency"].items():
+        for neighbor in neighbors:
+            if str(neighbor) == str(node):
+                continue
+            adjacency[str(node)].add(str(neighbor))
+            adjacency.setdefault(str(neighbor), set()).add(str(node))
+    positions = {str(node): tuple(pos) for node, pos in data.get("positions", {}).items()}
+    return data.get("name", os.path.basename(path)), adjacency, positions
+
+def load_builtin_map(name):
+    return load_map(os.path.join(MAPS_DIR, BUILTIN_MAPS[name]))
+
+def generate_random_planar_map(node_count, seed=None):
+    # a triangulated grid (one random diagonal per square) is always planar; dropping a
+    # share of the edges gives irregular "provinces" while keeping it planar
+    rng = random.Random(seed)
+    width = max(1, int(node_count ** 0.5))
+    adjacency = {str(n): set() for n in range(node_count)}
+    positions = {}
+
+    def connect(a, b):
+        if b < node_count and rng.random() < 0.85:
+            adjacency[str(a)].add(str(b))
+            adjacency[str(b)].add(str(a))
+
+    for n in range(node_count):
+        row, col = divmod(n, width)
+        positions[str(n)] = (col + rng.uniform(-0.3, 0.3), -row + rng.uniform(-0.3, 0.3))
+        if col + 1 < width:
+            connect(n, n + 1)
+        connect(n, n + width)
+        if col + 1 < width:
+            if rng.random() < 0.5:
+                connect(n, n + width + 1)
+            elif n + width < node_count:
+                connect(n + 1, n + width)
+    return f"Random planar graph ({node_count} nodes)", adjacency, positions
+
+class IndexedSet:
+    # set with O(1) add, discard and uniform random pick (a list plus an index map),
+    # used for the conflicted variables and the free N-queens rows
+    def __init__(self, items=()):
+        self.items = []
+        self.position = {}
+        for item in items:
+            self.add(item)
+
+    def __len__(self):
+        return len(self.items)
+
+    def __contains__(self, item):
+        return item in self.position
+
+    def add(self, item):
+        if item not in self.position:
+            self.position[item] = len(self.items)
+            self.items.append(item)
+
+    def discard(self, item):
+        index = self.position.pop(item, None)
+        if index is None:
+            return
+        last = self.items.pop()
+        if last != item:
+            self.items[index] = last
+            self.position[last] = index
+
+    def choice(self, rng):
+        return self.items[rng.randrange(len(self.items))]
+
+class GraphColoringProblem:
+    # local-search view of map coloring: per-node counts of neighbors holding each color
+    # make conflicts(var, value) O(1) and a move O(degree)
+    def __init__(self, adjacency, color_count=4):
+        self.adjacency = {node: list(neighbors) for node, neighbors in adjacency.items()}
+        self.variables = list(self.adjacency)
+        self.domain_size = color_count
+        self.assignment = {}
+        self.counts = {}
+
+    def load(self, assignment):
+        self.assignment = dict(assignment)
+        self.counts = {node: [0] * self.domain_size for node in self.variables}
+        for node, color in self.assignment.items():
+            for neighbor in self.adjacency[node]:
+                self.counts[neighbor][color] += 1
+
+    def initial_assignment(self, rng):
+        # greedy pass in random order: each node takes its least conflicting color so far
+        self.load({})
+        order = self.variables[:]
+        rng.shuffle(order)
+        for node in order:
+            self.assign(node, min(self.candidate_values(node, rng), key=lambda c: self.counts[node][c]))
+        return self.assignment
+
+    def candidate_values(self, var, rng):
+        return range(self.domain_size)
+
+    def conflicts(self, var, value):
+        return self.counts[var][value]
+
+    def total_conflicts(self):
+        return sum(self.counts[node][color] for node, color in self.assignment.items()) // 2
+
+    def assign(self, var, value):
+        old = self.assignment.get(var)
+        self.assignment[var] = value
+        for neighbor in self.adjacency[var]:
+            if old is not None:
+                self.counts[neighbor][old] -= 1
+            self.counts[neighbor][value] += 1
+        return [var] + self.adjacency[var]
+
+class NQueensProblem:
+    # one queen per column, the value is its row; rows and both diagonals keep the set of
+    # columns on them so a move only re-checks the queens sharing a line with it
+    def __init__(self, n, sample_size=64):
+        self.n = n
+        self.variables = list(range(n))
+        self.domain_size = n
+        self.sample_size = sample_size
+        self.assignment = {}
+
+    def load(self, assignment):
+        self.assignment = {}
+        self.rows, self.diagonals, self.anti_diagonals = {}, {}, {}
+        self.free_rows = IndexedSet(range(self.n))
+        for col, row in assignment.items():
+            self.assign(col, row)
+
+    def _lines(self, col, row):
+        return ((self.rows, row), (self.diagonals, row - col), (self.anti_diagonals, row + col))
+
+    def initial_assignment(self, rng):
+        # Minton-style greedy start: each column tries free rows, stopping at the first
+        # unattacked one, which leaves only a handful of conflicts for the repair phase
+        self.load({})
+        for col in self.variables:
+            best_row, best_conflicts = None, None
+            for row in self.candidate_values(col, rng):
+                conflicts = self.conflicts(col, row)
+                if best_conflicts is None or conflicts < best_conflicts:
+                    best_row, best_conflicts = row, conflicts
+                    if conflicts == 0:
+                        break
+            self.assign(col, best_row)
+        return self.assignment
+
+    def candidate_values(self, var, rng):
+        # scanning all n rows would make every step O(n); near a solution almost every row
+        # holds a queen, so sample the empty rows (falling back to any row) instead
+        # (a generator, so the greedy start stops drawing once it finds a free spot)
+        if self.n <= self.sample_size:
+            yield from range(self.n)
+        elif len(self.free_rows) >= self.sample_size:
+            for _ in range(self.sample_size):
+                yield self.free_rows.choice(rng)
+        else:
+            yield from list(self.free_rows.items)
+            for _ in range(self.sample_size):
+                yield rng.randrange(self.n)
+
+    def conflicts(self, var, value):
+        total = 0
+        for lines, key in self._lines(var, value):
+            members = lines.get(key, ())
+            total += len(members) - (var in members)
+        return total
+
+    def total_conflicts(self):
+        return sum(len(members) * (len(members) - 1) // 2
+                   for lines in (self.rows, self.diagonals, self.anti_diagonals)
+                   for members in lines.values())
+
+    def assign(self, var, value):
+        affected = [var]
+        old = self.assignment.get(var)
+        if old is not None:
+            for lines, key in self._lines(var, old):
+                lines[key].discard(var)
+                affected.extend(lines[key])
+                if not lines[key]:
+                    del lines[key]
+                    if lines is self.rows:
+                        self.free_rows.add(key)
+        self.assignment[var] = value
+        for lines, key in self._lines(var, value):
+            members = lines.setdefault(key, set())
+            affected.extend(members)
+            members.add(var)
+        self.free_rows.discard(value)
+        return affected
+
+def min_conflicts_search(problem, initial=None, max_steps=100000, restarts=5, tabu_tenure=10, seed=None):
+    # min-conflicts local search over any problem exposing variables, initial_assignment,
+    # candidate_values, conflicts, total_conflicts and assign (see the two classes above).
+    # A (variable, value) pair just left is tabu for tabu_tenure steps unless taking it
+    # clears every conflict, and the search restarts from a fresh greedy start when a
+    # round uses up max_steps; the best assignment over all rounds is returned.
+    start = time.perf_counter()
+    rng = random.Random(seed)
+    best, best_conflicts = None, None
+    steps_taken = 0
+    rounds = 0
+    for round_index in range(restarts + 1):
+        rounds += 1
+        if round_index == 0 and initial is not None:
+            problem.load(initial)
+        else:
+            problem.initial_assignment(rng)
+        total = problem.total_conflicts()
+
+        conflicted = IndexedSet()
+        def mark(var):
+            if problem.conflicts(var, problem.assignment[var]) > 0:
+                conflicted.add(var)
+            else:
+                conflicted.discard(var)
+
+        for var in problem.variables:
+            mark(var)
+        tabu = {}
+        for step in range(max_steps):
+            if not conflicted:
+                break
+            steps_taken += 1
+            var = conflicted.choice(rng)
+            current = problem.assignment[var]
+            current_conflicts = problem.conflicts(var, current)
+            best_values, best_score = [], None
+            for value in problem.candidate_values(var, rng):
+                if value == current:
+                    continue
+                score = problem.conflicts(var, value)
+                if tabu.get((var, value), -1) >= step and total - current_conflicts + score > 0:
+                    continue
+                if best_score is None or score < best_score:
+                    best_values, best_score = [value], score
+                elif score == best_score:
+                    best_values.append(value)
+            if not best_values:
+                continue
+            value = rng.choice(best_values)
+            tabu[(var, current)] = step + tabu_tenure
+            total += best_score - current_conflicts
+            for changed in problem.assign(var, value):
+                mark(changed)
+        if best_conflicts is None or total < best_conflicts:
+            best, best_conflicts = dict(problem.assignment), total
+        if best_conflicts == 0:
+            break
+    return {
+        "assignment": best,
+        "solved": best_conflicts == 0,
+        "conflicts": best_conflicts,
+        "method": "min-conflicts + tabu",
+        "steps": steps_taken,
+        "restarts": rounds - 1,
+        "seconds": time.perf_counter() - start,
+    }
+
+class MapColoringCSP:
+    def __init__(self, adjacency, color_count=4):
+        self.nodes = list(adjacency)
+        self.adjacency = {node: list(neighbors) for node, neighbors in adjacency.items()}
+        self.color_count = color_count
+        self.backtracks = 0
+        self.search_exhausted = False
+
+    def count_conflicts(self, assignment):
+        return sum(1 for node, neighbors in self.adjacency.items()
+                   for neighbor in neighbors
+                   if node < neighbor and node in assignment
+                   and assignment.get(neighbor) == assignment[node])
+
+    def solve(self, max_backtracks=20000, max_steps=200000, seed=None):
+        # DSATUR first; if the greedy pass runs out of colors fall back to DSATUR-ordered
+        # backtracking, and if that hits the backtrack limit finish with min-conflicts
+        start = time.perf_counter()
+        self.backtracks = 0
+        self.search_exhausted = False
+        method = "DSATUR"
+        assignment = self.dsatur()
+        if assignment is None:
+            method = "DSATUR + backtracking"
+            assignment = self.backtracking(max_backtracks)
+        if assignment is None and self.search_exhausted:
+            # backtracking proved there is no solution with this many colors
+            assignment = self.dsatur(allow_conflicts=True)
+        elif assignment is None:
+            method = "DSATUR + min-conflicts"
+            assignment = self.min_conflicts(self.dsatur(allow_conflicts=True), max_steps, seed)
+        conflicts = self.count_conflicts(assignment)
+        return {
+            "assignment": assignment,
+            "solved": conflicts == 0,
+            "conflicts": conflicts,
+            "method": method,
+            "backtracks": self.backtracks,
+            "colors_used": len(set(assignment.values())),
+            "seconds": time.perf_counter() - start,
+        }
+
+    def dsatur(self, allow_conflicts=False):
+        # greedy coloring, always picking the node with the most differently colored
+        # neighbors (ties broken by degree); a heap with lazy deletion keeps it O(E log V)
+        assignment = {}
+        neighbor_colors = {node: set() for node in self.nodes}
+        heap = [(0, -len(self.adjacency[node]), index, node) for index, node in enumerate(self.nodes)]
+        heapq.heapify(heap)
+        order = {node: index for index, node in enumerate(self.nodes)}
+        while heap:
+            saturation, degree, index, node = heapq.heappop(heap)
+            if node in assignment or -saturation != len(neighbor_colors[node]):
+                continue
+            color = next((c for c in range(self.color_count) if c not in neighbor_colors[node]), None)
+            if color is None:
+                if not allow_conflicts:
+                    return None
+                color = self._least_conflicting_color(node, assignment)
+            assignment[node] = color
+            for neighbor in self.adjacency[node]:
+                if neighbor not in assignment and color not in neighbor_colors[neighbor]:
+                    neighbor_colors[neighbor].add(color)
+                    heapq.heappush(heap, (-len(neighbor_colors[neighbor]), -len(self.adjacency[neighbor]),
+                                          order[neighbor], neighbor))
+        return assignment
+
+    def backtracking(self, max_backtracks):
+        # iterative so 10k-node maps don't hit the recursion limit; variables are chosen
+        # DSATUR-style and forward checking rejects a color that empties a neighbor's domain
+        k = self.color_count
+        counts = {node: [0] * k for node in self.nodes}
+        saturation = {node: 0 for node in self.nodes}
+        order = {node: index for index, node in enumerate(self.nodes)}
+        assignment = {}
+        heap = [(k, -len(self.adjacency[node]), order[node], node) for node in self.nodes]
+        heapq.heapify(heap)
+
+        def push(node):
+            heapq.heappush(heap, (k - saturation[node], -len(self.adjacency[node]), order[node], node))
+
+        def next_variable():
+            while heap:
+                remaining, _, _, node = heapq.heappop(heap)
+                if node not in assignment and remaining == k - saturation[node]:
+                    return node
+            return None
+
+        def candidates(node):
+            return [c for c in reversed(range(k)) if counts[node][c] == 0]
+
+        def assign(node, color):
+            assignment[node] = color
+            wiped_out = False
+            for neighbor in self.adjacency[node]:
+                counts[neighbor][color] += 1
+                if counts[neighbor][color] == 1:
+                    saturation[neighbor] += 1
+                    if neighbor not in assignment:
+                        push(neighbor)
+                        if saturation[neighbor] == k:
+                            wiped_out = True
+            return not wiped_out
+
+        def unassign(node):
+            color = assignment.pop(node)
+            for neighbor in self.adjacency[node]:
+                counts[neighbor][color] -= 1
+                if counts[neighbor][color] == 0:
+                    saturation[neighbor] -= 1
+                    if neighbor not in assignment:
+                        push(neighbor)
+
+        stack = []
+        node = next_variable()
+        values = candidates(node) if node is not None else []
+        while node is not None:
+            if values:
+                color = values.pop()
+                if not assign(node, color):
+                    unassign(node)
+                    continue
+                stack.append((node, values))
+                node = next_variable()
+                values = candidates(node) if node is not None else []
+            else:
+                self.backtracks += 1
+                if not stack:
+                    self.search_exhausted = True
+                    return None
+                if self.backtracks > max_backtracks:
+                    return None
+                push(node)
+                node, values = stack.pop()
+                unassign(node)
+        return assignment
+
+    def min_conflicts(self, assignment, max_steps=200000, seed=None):
+        result = min_conflicts_search(GraphColoringProblem(self.adjacency, self.color_count),
+                                      initial=assignment, max_steps=max_steps, restarts=0, seed=seed)
+        return result["assignment"]
+
+    def _conflicts(self, node, color, assignment):
+        return sum(1 for neighbor in self.adjacency[node] if assignment.get(neighbor) == color)
+
+    def _least_conflicting_color(self, node, assignment, rng=random):
+        scores = [self._conflicts(node, color, assignment) for color in range(self.color_count)]
+        best = min(scores)
+        return rng.choice([color for color, score in enumerate(scores) if score == best])
+
+def benchmark_min_conflicts(sizes=(1000, 10000, 100000), seed=0):
+    for size in sizes:
+        _, adjacency, _ = generate_random_planar_map(size, seed=seed)
+        result = min_conflicts_search(GraphColoringProblem(adjacency, 4), max_steps=50 * size, seed=seed)
+        print(f"coloring {size:>6} nodes: solved={result['solved']} conflicts={result['conflicts']} "
+              f"steps={result['steps']} restarts={result['restarts']} time={result['seconds']:.2f}s")
+    for size in sizes:
+        result = min_conflicts_search(NQueensProblem(size), max_steps=50 * size, seed=seed)
+        print(f"n-queens {size:>6} queens: solved={result['solved']} conflicts={result['conflicts']} "
+              f"steps={result['steps']} restarts={result['restarts']} time={result['seconds']:.2f}s")
+
+if __name__ == "__main__":
+    import sys
+    if "--benchmark" in sys.argv:
+        benchmark_min_conflicts()
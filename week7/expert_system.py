@@ -1,6 +1,15 @@
 import sys
 import json
 import os
+import time
+import argparse
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+import sqlite3
+import heapq
+import itertools
+import math
+from collections import Counter
 from datetime import datetime
 from typing import Dict, List, Optional, Any
 from PyQt6.QtWidgets import (
@@ -12,6 +21,13 @@ from PyQt6.QtWidgets import (
 from PyQt6.QtCore import Qt
 from PyQt6.QtGui import QFont
 
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+    print("NumPy not available. Bayesian diagnosis will score classes one at a time.")
+
 class TroubleshootingRule:
     """Represents a troubleshooting rule with symptoms and solutions."""
     def __init__(self, rule_id: str, title: str, description: str, 
@@ -53,11 +69,14 @@ class TroubleshootingRule:
 class TroubleshootingCase:
     """Represents a troubleshooting case/session."""
     def __init__(self, case_id: str, symptoms: List[str],
-                 diagnosis: str = "", solutions: List[str] = None):
+                 diagnosis: str = "", solutions: List[str] = None, rule_id: Optional[str] = None,
+                 confirmed: bool = False):
         self.case_id = case_id
         self.symptoms = symptoms
         self.diagnosis = diagnosis
         self.solutions = solutions or []
+        self.rule_id = rule_id # the rule the case was diagnosed as, if any
+        self.confirmed = confirmed # the user confirmed rule_id resolved the problem
         self.created_date = datetime.now().isoformat()
     
     def to_dict(self) -> Dict[str, Any]:
@@ -66,6 +85,8 @@ class TroubleshootingCase:
             "symptoms": self.symptoms,
             "diagnosis": self.diagnosis,
             "solutions": self.solutions,
+            "rule_id": self.rule_id,
+            "confirmed": self.confirmed,
             "created_date": self.created_date
         }
     
@@ -73,54 +94,466 @@ class TroubleshootingCase:
     def from_dict(cls, data: Dict[str, Any]) -> 'TroubleshootingCase':
         case = cls(
             data["case_id"], data["symptoms"],
-            data.get("diagnosis", ""), data.get("solutions", [])
+            data.get("diagnosis", ""), data.get("solutions", []), data.get("rule_id"),
+            data.get("confirmed", False)
         )
         case.created_date = data.get("created_date", datetime.now().isoformat())
         return case
     
+class NaiveBayesModel:
+    """Multinomial naive Bayes over symptoms, with one class per rule.
+
+    Each rule counts as one observation of its own symptoms, and every saved
+    case the user confirmed was resolved by a rule adds another, so the model
+    starts from the rule base and sharpens as cases accumulate. Only the
+    sufficient statistics are kept (observations and symptom totals per class,
+    and a sparse count per symptom and class) and they are updated in place;
+    there is no training pass.
+    """
+    def __init__(self, alpha: float = 1.0):
+        self.alpha = alpha
+        self.class_ids: List[str] = []
+        self.class_rows: Dict[str, int] = {}
+        self.observations = self._zeros(16)
+        self.symptom_totals = self._zeros(16)
+        self.active = self._zeros(16, bool)
+        # normalized symptom -> {class row: observations containing it}
+        self.symptom_counts: Dict[str, Dict[int, int]] = {}
+        
+    @staticmethod
+    def _zeros(size: int, dtype=float):
+        if NUMPY_AVAILABLE:
+            return np.zeros(size, dtype=dtype)
+        return [dtype()] * size
+    
+    def _grow(self, array, size: int):
+        if NUMPY_AVAILABLE:
+            grown = self._zeros(size, array.dtype)
+            grown[:len(array)] = array
+            return grown
+        return array + [type(array[0])()] * (size - len(array))
+    
+    def _row(self, rule_id: str) -> int:
+        row = self.class_rows.get(rule_id)
+        if row is None:
+            row = len(self.class_ids)
+            if row == len(self.observations):
+                self.observations = self._grow(self.observations, row * 2)
+                self.symptom_totals = self._grow(self.symptom_totals, row * 2)
+                self.active = self._grow(self.active, row * 2)
+            self.class_ids.append(rule_id)
+            self.class_rows[rule_id] = row
+        return row
+    
+    def set_active(self, rule_id: str, active: bool):
+        """Only classes whose rule exists are scored; a deleted rule keeps its counts."""
+        self.active[self._row(rule_id)] = active
+        
+    def observe(self, rule_id: str, symptoms, weight: int = 1):
+        """Add (weight 1) or remove (weight -1) one observation of symptoms for a rule."""
+        row = self._row(rule_id)
+        symptoms = set(symptoms)
+        self.observations[row] += weight
+        self.symptom_totals[row] += weight * len(symptoms)
+        for symptom in symptoms:
+            column = self.symptom_counts.setdefault(symptom, {})
+            count = column.get(row, 0) + weight
+            if count:
+                column[row] = count
+            else:
+                del column[row]
+                if not column:
+                    del self.symptom_counts[symptom]
+                    
+    def predict(self, symptoms, top: int = 5) -> List[tuple]:
+        """Return up to top (rule_id, posterior probability) pairs, most probable first."""
+        symptoms = set(symptoms)
+        if not any(symptom in self.symptom_counts for symptom in symptoms):
+            # nothing selected is evidence for any rule; the prior alone is not a diagnosis
+            return []
+        size = len(self.class_ids)
+        alpha = self.alpha
+        vocabulary = max(len(self.symptom_counts), 1)
+        # log P(rule) + sum over symptoms of log P(symptom | rule), with Laplace smoothing;
+        # every class gets the unseen-symptom term, and classes that have seen a symptom
+        # get a sparse correction on top
+        if NUMPY_AVAILABLE:
+            active = self.active[:size]
+            if not active.any():
+                return []
+            scores = (np.log(self.observations[:size] + 1.0)
+                      - len(symptoms) * (np.log(self.symptom_totals[:size] + alpha * vocabulary) - math.log(alpha)))
+            for symptom in symptoms:
+                column = self.symptom_counts.get(symptom)
+                if column:
+                    rows = np.fromiter(column.keys(), dtype=np.intp, count=len(column))
+                    counts = np.fromiter(column.values(), dtype=float, count=len(column))
+                    scores[rows] += np.log1p(counts / alpha)
+            scores[~active] = -np.inf
+            posterior = np.exp(scores - scores.max())
+            posterior /= posterior.sum()
+            count = min(top, int(active.sum()))
+            best = np.argpartition(-posterior, count - 1)[:count]
+            best = best[np.argsort(-posterior[best], kind="stable")]
+            return [(self.class_ids[row], float(posterior[row])) for row in best]
+        
+        scores = {}
+        for row in range(size):
+            if self.active[row]:
+                scores[row] = (math.log(self.observations[row] + 1.0)
+                               - len(symptoms) * (math.log(self.symptom_totals[row] + alpha * vocabulary) - math.log(alpha)))
+        if not scores:
+            return []
+        for symptom in symptoms:
+            for row, count in self.symptom_counts.get(symptom, {}).items():
+                if row in scores:
+                    scores[row] += math.log1p(count / alpha)
+        highest = max(scores.values())
+        weights = {row: math.exp(score - highest) for row, score in scores.items()}
+        total = sum(weights.values())
+        best = heapq.nlargest(top, weights.items(), key=lambda item: item[1])
+        return [(self.class_ids[row], weight / total) for row, weight in best]
+    
+# set bits in each byte value, for NumPy versions without bitwise_count (before 2.0)
+_BYTE_POPCOUNT = np.array([bin(value).count("1") for value in range(256)], dtype=np.uint8) if NUMPY_AVAILABLE else None
+
+def popcount(words):
+    """Number of set bits in each element of a uint64 array."""
+    if hasattr(np, "bitwise_count"):
+        return np.bitwise_count(words)
+    return _BYTE_POPCOUNT[words.view(np.uint8)].reshape(-1, 8).sum(axis=1)
+
+class CaseIndex:
+    """Similarity search over saved cases by their symptom sets.
+
+    Each case is a bit vector with one bit per normalized symptom, stored as
+    64-bit words (one array of words per 64 symptoms, so a query reads only
+    the words its own symptoms fall in). Jaccard similarity is
+    |case & query| / (|case| + |query| - |case & query|), where the
+    intersection is a popcount and each case's own popcount is kept.
+    """
+    def __init__(self):
+        self.symptom_bits: Dict[str, int] = {}
+        self.case_ids: List[Optional[str]] = []
+        self.case_rows: Dict[str, int] = {}
+        self.free_rows: List[int] = []
+        if NUMPY_AVAILABLE:
+            self.words = np.zeros((1, 64), dtype=np.uint64)
+            self.sizes = np.zeros(64, dtype=np.int64)
+            self.resolved = np.zeros(64, dtype=bool)
+        else:
+            self.vectors: List[int] = []
+            self.sizes = []
+            self.resolved = []
+            
+    def _bit(self, symptom: str) -> int:
+        bit = self.symptom_bits.get(symptom)
+        if bit is None:
+            bit = self.symptom_bits[symptom] = len(self.symptom_bits)
+            if NUMPY_AVAILABLE and bit >> 6 == len(self.words):
+                self.words = np.vstack([self.words, np.zeros_like(self.words)])
+        return bit
+    
+    def _new_row(self) -> int:
+        if self.free_rows:
+            return self.free_rows.pop()
+        row = len(self.case_ids)
+        self.case_ids.append(None)
+        if not NUMPY_AVAILABLE:
+            self.vectors.append(0)
+            self.sizes.append(0)
+            self.resolved.append(False)
+        elif row == len(self.sizes):
+            self.words = np.hstack([self.words, np.zeros_like(self.words)])
+            self.sizes = np.concatenate([self.sizes, np.zeros_like(self.sizes)])
+            self.resolved = np.concatenate([self.resolved, np.zeros_like(self.resolved)])
+        return row
+    
+    def add(self, case_id: str, symptoms, resolved: bool):
+        """Index a case, replacing any earlier version of it."""
+        self.remove(case_id)
+        row = self._new_row()
+        bits = {self._bit(symptom) for symptom in symptoms}
+        if NUMPY_AVAILABLE:
+            for bit in bits:
+                self.words[bit >> 6, row] |= np.uint64(1 << (bit & 63))
+        else:
+            self.vectors[row] = sum(1 << bit for bit in bits)
+        self.sizes[row] = len(bits)
+        self.resolved[row] = resolved
+        self.case_ids[row] = case_id
+        self.case_rows[case_id] = row
+        
+    def remove(self, case_id: str):
+        row = self.case_rows.pop(case_id, None)
+        if row is None:
+            return
+        if NUMPY_AVAILABLE:
+            self.words[:, row] = 0
+        else:
+            self.vectors[row] = 0
+        self.sizes[row] = 0
+        self.resolved[row] = False
+        self.case_ids[row] = None
+        self.free_rows.append(row)
+        
+    def set_resolved(self, case_id: str, resolved: bool):
+        row = self.case_rows.get(case_id)
+        if row is not None:
+            self.resolved[row] = resolved
+        
+    def search(self, symptoms, k: int = 5, resolved_only: bool = True) -> List[tuple]:
+        """Return up to k (case_id, jaccard) pairs sharing at least one symptom, best first."""
+        symptoms = set(symptoms)
+        bits = [self.symptom_bits[symptom] for symptom in symptoms if symptom in self.symptom_bits]
+        if not bits:
+            return []
+        size = len(self.case_ids)
+        if NUMPY_AVAILABLE:
+            query = {}
+            for bit in bits:
+                query[bit >> 6] = query.get(bit >> 6, 0) | (1 << (bit & 63))
+            shared = np.zeros(size, dtype=np.int64)
+            for word, mask in query.items():
+                shared += popcount(self.words[word, :size] & np.uint64(mask))
+            similarity = shared / np.maximum(self.sizes[:size] + len(symptoms) - shared, 1)
+            if resolved_only:
+                similarity[~self.resolved[:size]] = 0.0
+            rows = np.flatnonzero(similarity)
+            if len(rows) > k:
+                rows = rows[np.argpartition(-similarity[rows], k - 1)[:k]]
+            rows = rows[np.argsort(-similarity[rows], kind="stable")]
+            return [(self.case_ids[row], float(similarity[row])) for row in rows]
+        
+        query = sum(1 << bit for bit in bits)
+        scored = []
+        for row, vector in enumerate(self.vectors):
+            if resolved_only and not self.resolved[row]:
+                continue
+            shared = (vector & query).bit_count()
+            if shared:
+                scored.append((shared / (self.sizes[row] + len(symptoms) - shared), row))
+        best = heapq.nlargest(k, scored, key=lambda item: item[0])
+        return [(self.case_ids[row], similarity) for similarity, row in best]
+    
 class DataManager:
-    """Handles all CRUD operations and JSON persistence."""
-    def __init__(self, filename: str = "expert_system_data.json"):
+    """Handles all CRUD operations and SQLite persistence.
+
+    Every create/update/delete writes only the affected record in its own
+    transaction. Data saved by earlier versions in the JSON file is copied
+    into the database the first time it is opened.
+    """
+    SCHEMA_VERSION = 3
+    
+    def __init__(self, filename: str = "expert_system_data.json", db_path: Optional[str] = None):
         self.filename = filename
+        self.db_path = db_path or os.path.splitext(filename)[0] + ".db"
+        self.conn = None
         self.rules: Dict[str, TroubleshootingRule] = {}
         self.cases: Dict[str, TroubleshootingCase] = {}
         self.symptoms_list = set()
+        # normalized symptom -> {rule_id: times the rule lists it}
+        self.symptom_index: Dict[str, Counter] = {}
+        # normalized symptom -> indexed symptoms that contain it or are contained in it
+        self.related: Dict[str, set] = {}
+        # trigram -> indexed symptoms containing it, to find symptoms that contain a new one
+        self.symptom_trigrams: Dict[str, set] = {}
+        self.symptom_counts = Counter()
+        self.rule_order: Dict[str, int] = {}
+        self._order = itertools.count()
+        self.bayes = NaiveBayesModel()
+        self.case_index = CaseIndex()
+        # rule_id -> cases the user confirmed that rule resolved
+        self.rule_cases: Dict[str, set] = {}
         self.load_data() 
         
     def load_data(self):
-        """Load data from JSON file."""
-        if os.path.exists(self.filename):
-            try:
-                with open(self.filename, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    
-                    # Load rules
-                    for rule_data in data.get("rules", []):
-                        rule = TroubleshootingRule.from_dict(rule_data)
-                        self.rules[rule.rule_id] = rule
-                        self.symptoms_list.update(rule.symptoms)
-                    # Load cases
-                    for case_data in data.get("cases", []):
-                        case = TroubleshootingCase.from_dict(case_data)
-                        self.cases[case.case_id] = case   
-            except Exception as e:
-                print(f"Error loading data: {e}")
+        """Load data from the database, migrating the JSON file or creating samples on first run."""
+        self.conn = sqlite3.connect(self.db_path)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA foreign_keys=ON")
+        version = self.conn.execute("PRAGMA user_version").fetchone()[0]
+        if version == 0:
+            self.create_tables()
+            if os.path.exists(self.filename):
+                self.migrate_json()
+            else:
                 self.create_sample_data()
-        else:
-            self.create_sample_data()
+            return
+        if version < self.SCHEMA_VERSION:
+            self.upgrade_tables(version)
+        try:
+            self.load_tables()
+        except sqlite3.Error as e:
+            print(f"Error loading data: {e}")
             
-    def save_data(self):
-        """Save data to JSON file."""
-        data = {
-            "rules": [rule.to_dict() for rule in self.rules.values()],
-            "cases": [case.to_dict() for case in self.cases.values()],
-            "symptoms": list(self.symptoms_list)
-        }
+    def create_tables(self):
+        """Create the schema if it does not exist yet."""
+        with self.conn:
+            self.conn.executescript('''
+                CREATE TABLE IF NOT EXISTS rules (
+                    rule_id TEXT PRIMARY KEY,
+                    title TEXT NOT NULL,
+                    description TEXT,
+                    solution TEXT,
+                    category TEXT,
+                    priority INTEGER DEFAULT 1,
+                    confidence REAL DEFAULT 0.8,
+                    created_date TEXT
+                );
+                CREATE TABLE IF NOT EXISTS symptoms (
+                    symptom_id INTEGER PRIMARY KEY,
+                    name TEXT NOT NULL UNIQUE
+                );
+                CREATE TABLE IF NOT EXISTS rule_symptoms (
+                    rule_id TEXT NOT NULL REFERENCES rules(rule_id) ON DELETE CASCADE,
+                    position INTEGER NOT NULL,
+                    symptom_id INTEGER NOT NULL REFERENCES symptoms(symptom_id),
+                    PRIMARY KEY (rule_id, position)
+                );
+                CREATE INDEX IF NOT EXISTS idx_rule_symptoms_symptom ON rule_symptoms(symptom_id);
+                CREATE TABLE IF NOT EXISTS cases (
+                    case_id TEXT PRIMARY KEY,
+                    symptoms TEXT NOT NULL,
+                    diagnosis TEXT,
+                    solutions TEXT,
+                    created_date TEXT,
+                    rule_id TEXT,
+                    confirmed INTEGER NOT NULL DEFAULT 0
+                );
+            ''')
+            
+    def upgrade_tables(self, version: int):
+        """Bring a database written by an older version up to SCHEMA_VERSION."""
+        with self.conn:
+            if version < 2:
+                self.conn.execute("ALTER TABLE cases ADD COLUMN rule_id TEXT")
+            if version < 3:
+                # labels saved before version 3 were the engine's own top match, never confirmed
+                self.conn.execute("ALTER TABLE cases ADD COLUMN confirmed INTEGER NOT NULL DEFAULT 0")
+            self.conn.execute(f"PRAGMA user_version = {self.SCHEMA_VERSION}")
+            
+    def load_tables(self):
+        """Load every rule and case into memory, in the order they were first saved."""
+        symptoms = {}
+        for rule_id, name in self.conn.execute('''
+                SELECT rule_symptoms.rule_id, symptoms.name FROM rule_symptoms
+                JOIN symptoms ON symptoms.symptom_id = rule_symptoms.symptom_id
+                ORDER BY rule_symptoms.rule_id, rule_symptoms.position'''):
+            symptoms.setdefault(rule_id, []).append(name)
+        for row in self.conn.execute('''
+                SELECT rule_id, title, description, solution, category, priority, confidence, created_date
+                FROM rules ORDER BY rowid'''):
+            rule = TroubleshootingRule(row[0], row[1], row[2], symptoms.get(row[0], []),
+                                       row[3], row[4], row[5], row[6])
+            rule.created_date = row[7]
+            self.rules[rule.rule_id] = rule
+            self._index_rule(rule)
+        for row in self.conn.execute(
+                "SELECT case_id, symptoms, diagnosis, solutions, created_date, rule_id, confirmed FROM cases ORDER BY rowid"):
+            case = TroubleshootingCase(row[0], json.loads(row[1]), row[2], json.loads(row[3]), row[5], bool(row[6]))
+            case.created_date = row[4]
+            self.cases[case.case_id] = case
+            self._index_case(case)
+            
+    def migrate_json(self):
+        """One-time copy of the JSON data file into the database; the JSON file is left in place."""
         try:
-            with open(self.filename, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            with open(self.filename, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+                
+                # Load rules
+                for rule_data in data.get("rules", []):
+                    rule = TroubleshootingRule.from_dict(rule_data)
+                    self.rules[rule.rule_id] = rule
+                    self._index_rule(rule)
+                # Load cases
+                for case_data in data.get("cases", []):
+                    case = TroubleshootingCase.from_dict(case_data)
+                    self.cases[case.case_id] = case   
+                    self._index_case(case)
         except Exception as e:
+            print(f"Error loading data: {e}")
+            self.create_sample_data()
+            return
+        self.save_data()
+        
+    def save_data(self):
+        """Write every rule and case to the database in one transaction."""
+        try:
+            with self.conn:
+                for rule in self.rules.values():
+                    self._write_rule(rule)
+                for case in self.cases.values():
+                    self._write_case(case)
+                self.conn.execute(f"PRAGMA user_version = {self.SCHEMA_VERSION}")
+        except sqlite3.Error as e:
+            print(f"Error saving data: {e}")
+            
+    def _write_rule(self, rule: TroubleshootingRule):
+        """Upsert one rule and its symptom links (the caller owns the transaction)."""
+        old_symptom_ids = [row[0] for row in self.conn.execute(
+            "SELECT symptom_id FROM rule_symptoms WHERE rule_id = ?", (rule.rule_id,))]
+        # an upsert keeps the rule's rowid, so it keeps its place in the rule order
+        self.conn.execute('''
+            INSERT INTO rules (rule_id, title, description, solution, category, priority, confidence, created_date)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT(rule_id) DO UPDATE SET
+                title = excluded.title, description = excluded.description, solution = excluded.solution,
+                category = excluded.category, priority = excluded.priority,
+                confidence = excluded.confidence, created_date = excluded.created_date
+        ''', (rule.rule_id, rule.title, rule.description, rule.solution, rule.category,
+              rule.priority, rule.confidence, rule.created_date))
+        self.conn.execute("DELETE FROM rule_symptoms WHERE rule_id = ?", (rule.rule_id,))
+        for position, symptom in enumerate(rule.symptoms):
+            self.conn.execute("INSERT OR IGNORE INTO symptoms (name) VALUES (?)", (symptom,))
+            self.conn.execute('''
+                INSERT INTO rule_symptoms (rule_id, position, symptom_id)
+                SELECT ?, ?, symptom_id FROM symptoms WHERE name = ?
+            ''', (rule.rule_id, position, symptom))
+        self._delete_unused_symptoms(old_symptom_ids)
+        
+    def _delete_unused_symptoms(self, symptom_ids: List[int]):
+        """Drop the given symptoms if no rule links to them any more."""
+        self.conn.executemany('''
+            DELETE FROM symptoms WHERE symptom_id = ?
+            AND NOT EXISTS (SELECT 1 FROM rule_symptoms WHERE rule_symptoms.symptom_id = symptoms.symptom_id)
+        ''', [(symptom_id,) for symptom_id in set(symptom_ids)])
+        
+    def _write_case(self, case: TroubleshootingCase):
+        """Upsert one case (the caller owns the transaction)."""
+        self.conn.execute('''
+            INSERT INTO cases (case_id, symptoms, diagnosis, solutions, created_date, rule_id, confirmed)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT(case_id) DO UPDATE SET
+                symptoms = excluded.symptoms, diagnosis = excluded.diagnosis, solutions = excluded.solutions,
+                created_date = excluded.created_date, rule_id = excluded.rule_id, confirmed = excluded.confirmed
+        ''', (case.case_id, json.dumps(case.symptoms, ensure_ascii=False), case.diagnosis,
+              json.dumps(case.solutions, ensure_ascii=False), case.created_date, case.rule_id, int(case.confirmed)))
+        
+    def _commit(self, write, *args) -> bool:
+        """Run one record write in its own transaction; False if the database refused it."""
+        try:
+            with self.conn:
+                write(*args)
+            return True
+        except sqlite3.Error as e:
             print(f"Error saving data: {e}")
+            return False
+        
+    def _delete_rule_row(self, rule_id: str):
+        symptom_ids = [row[0] for row in self.conn.execute(
+            "SELECT symptom_id FROM rule_symptoms WHERE rule_id = ?", (rule_id,))]
+        self.conn.execute("DELETE FROM rules WHERE rule_id = ?", (rule_id,))
+        self._delete_unused_symptoms(symptom_ids)
+        
+    def _delete_case_row(self, case_id: str):
+        self.conn.execute("DELETE FROM cases WHERE case_id = ?", (case_id,))
+        
+    def close(self):
+        if self.conn is not None:
+            self.conn.close()
+            self.conn = None
             
     def create_sample_data(self):
         """Create sample troubleshooting rules and data."""
@@ -165,16 +598,124 @@ class DataManager:
         
         for rule in sample_rules:
             self.rules[rule.rule_id] = rule
-            self.symptoms_list.update(rule.symptoms)
+            self._index_rule(rule)
             
         self.save_data()
         
+    # Symptom index
+    @staticmethod
+    def normalize_symptom(symptom: str) -> str:
+        """Lowercase and collapse whitespace so equivalent symptoms share an index entry."""
+        return " ".join(symptom.lower().split())
+    
+    def _index_rule(self, rule: TroubleshootingRule):
+        """Add a rule's symptoms to the inverted index and the symptoms list."""
+        self.rule_order.setdefault(rule.rule_id, next(self._order))
+        for symptom in rule.symptoms:
+            key = self.normalize_symptom(symptom)
+            if key not in self.symptom_index:
+                self.symptom_index[key] = Counter()
+                self._relate(key)
+            self.symptom_index[key][rule.rule_id] += 1
+            self.symptom_counts[symptom] += 1
+            self.symptoms_list.add(symptom)
+        self.bayes.observe(rule.rule_id, map(self.normalize_symptom, rule.symptoms))
+        self.bayes.set_active(rule.rule_id, True)
+        for case_id in self.rule_cases.get(rule.rule_id, ()):
+            self.case_index.set_resolved(case_id, True)
+            
+    def _unindex_rule(self, rule: TroubleshootingRule):
+        """Remove a rule's symptoms; symptoms no other rule uses leave the symptoms list."""
+        for symptom in rule.symptoms:
+            key = self.normalize_symptom(symptom)
+            postings = self.symptom_index[key]
+            postings[rule.rule_id] -= 1
+            if postings[rule.rule_id] <= 0:
+                del postings[rule.rule_id]
+            if not postings:
+                del self.symptom_index[key]
+                for other in self.related.pop(key):
+                    if other != key:
+                        self.related[other].discard(key)
+                for trigram in self._trigrams(key):
+                    self.symptom_trigrams[trigram].discard(key)
+                    if not self.symptom_trigrams[trigram]:
+                        del self.symptom_trigrams[trigram]
+            self.symptom_counts[symptom] -= 1
+            if self.symptom_counts[symptom] <= 0:
+                del self.symptom_counts[symptom]
+                self.symptoms_list.discard(symptom)
+        self.bayes.observe(rule.rule_id, map(self.normalize_symptom, rule.symptoms), -1)
+        self.bayes.set_active(rule.rule_id, False)
+        # a case resolved by a deleted rule no longer points at a usable fix
+        for case_id in self.rule_cases.get(rule.rule_id, ()):
+            self.case_index.set_resolved(case_id, False)
+        
+    def _index_case(self, case: TroubleshootingCase, weight: int = 1):
+        """Count a confirmed case towards its rule's likelihoods and index it for retrieval
+        (weight -1 takes it back)."""
+        symptoms = [self.normalize_symptom(symptom) for symptom in case.symptoms]
+        confirmed = bool(case.rule_id and case.confirmed)
+        if confirmed:
+            self.bayes.observe(case.rule_id, symptoms, weight)
+        if weight > 0:
+            if confirmed:
+                self.rule_cases.setdefault(case.rule_id, set()).add(case.case_id)
+            # resolved means confirmed against a rule that still exists
+            self.case_index.add(case.case_id, symptoms, confirmed and case.rule_id in self.rules)
+        else:
+            if confirmed:
+                self.rule_cases[case.rule_id].discard(case.case_id)
+            self.case_index.remove(case.case_id)
+                
+    @staticmethod
+    def _trigrams(key: str) -> set:
+        return {key[i:i + 3] for i in range(len(key) - 2)}
+    
+    def _overlapping(self, key: str) -> set:
+        """Indexed symptoms that contain key or are contained in it."""
+        # symptoms inside key are among its substrings
+        found = {key[start:end] for start in range(len(key)) for end in range(start + 1, len(key) + 1)
+                 if key[start:end] in self.related}
+        trigrams = self._trigrams(key)
+        if not trigrams:
+            # too short to filter by trigrams
+            found.update(other for other in self.related if key in other)
+        elif all(trigram in self.symptom_trigrams for trigram in trigrams):
+            # symptoms containing key contain all of its trigrams; start from the rarest
+            postings = sorted((self.symptom_trigrams[trigram] for trigram in trigrams), key=len)
+            found.update(other for other in postings[0].intersection(*postings[1:]) if key in other)
+        return found
+    
+    def _relate(self, key: str):
+        """Link a new symptom to the indexed symptoms it overlaps with as a substring."""
+        related = self._overlapping(key)
+        for other in related:
+            self.related[other].add(key)
+        related.add(key)
+        self.related[key] = related
+        for trigram in self._trigrams(key):
+            self.symptom_trigrams.setdefault(trigram, set()).add(key)
+        
+    def related_symptoms(self, selected_symptoms: List[str]) -> set:
+        """Indexed symptoms matching any selected one (either is a substring of the other)."""
+        found = set()
+        for symptom in selected_symptoms:
+            key = self.normalize_symptom(symptom)
+            if key in self.related:
+                found |= self.related[key]
+            elif key:
+                # free text that no rule uses verbatim
+                found |= self._overlapping(key)
+        return found
+        
     # CRUD Operations for Rules
     def create_rule(self, rule: TroubleshootingRule):
         if rule.rule_id not in self.rules:
+            if not self._commit(self._write_rule, rule):
+                return False
             self.rules[rule.rule_id] = rule
-            self.symptoms_list.update(rule.symptoms)
-            self.save_data()
+            self._index_rule(rule)
             return True
         return False
     
@@ -186,34 +727,30 @@ class DataManager:
     
     def update_rule(self, rule: TroubleshootingRule) -> bool:
         if rule.rule_id in self.rules:
-            old_symptoms = self.rules[rule.rule_id].symptoms
+            if not self._commit(self._write_rule, rule):
+                return False
+            self._unindex_rule(self.rules[rule.rule_id])
             self.rules[rule.rule_id] = rule
-            # Update symptoms list
-            for symptom in old_symptoms:
-                if not any (symptom in r.symptoms for r in self.rules.values() if r.rule_id != rule.rule_id):
-                    self.symptoms_list.discard(symptom)
-            self.symptoms_list.update(rule.symptoms)
-            self.save_data()
+            self._index_rule(rule)
             return True
         return False
     
     def delete_rule(self, rule_id: str) -> bool:
         if rule_id in self.rules:
-            old_symptoms = self.rules[rule_id].symptoms
-            del self.rules[rule_id]
-            # Clean up symptoms that are no longer used 
-            for symptom in old_symptoms:
-                if not any(symptom in rule.symptoms for rule in self.rules.values()):
-                    self.symptoms_list.discard(symptom)
-            self.save_data()
+            if not self._commit(self._delete_rule_row, rule_id):
+                return False
+            self._unindex_rule(self.rules.pop(rule_id))
+            del self.rule_order[rule_id]
             return True
         return False
     
     # CRUD Operations for Cases
     def create_case(self, case: TroubleshootingCase):
         if case.case_id not in self.cases:
+            if not self._commit(self._write_case, case):
+                return False
             self.cases[case.case_id] = case
-            self.save_data()
+            self._index_case(case)
             return True
         return False
     
@@ -225,15 +762,19 @@ class DataManager:
     
     def update_case(self, case: TroubleshootingCase) -> bool:
         if case.case_id in self.cases:
+            if not self._commit(self._write_case, case):
+                return False
+            self._index_case(self.cases[case.case_id], -1)
             self.cases[case.case_id] = case
-            self.save_data()
+            self._index_case(case)
             return True
         return False
     
     def delete_case(self, case_id: str) -> bool:
         if case_id in self.cases:
-            del self.cases[case_id]
-            self.save_data()
+            if not self._commit(self._delete_case_row, case_id):
+                return False
+            self._index_case(self.cases.pop(case_id), -1)
             return True
         return False
     
@@ -248,24 +789,35 @@ class InferenceEngine:
         
     def diagnose(self, selected_symptoms: List[str]) -> List[tuple]:
         """Return list of (rule, confidence_score) tuples"""
+        data = self.data_manager
+        # count matched symptoms only for rules that share at least one with the selection
+        matched = Counter()
+        for symptom in data.related_symptoms(selected_symptoms):
+            matched.update(data.symptom_index[symptom])
+            
         matches = []
-        rules = self.data_manager.read_all_rules()
-        
-        for rule in rules:
-            matched_symptoms = 0
-            for symptom in rule.symptoms:
-                if any(s.lower() in symptom.lower() or symptom.lower() in s.lower() for s in selected_symptoms):
-                    matched_symptoms += 1
-                    
-            if matched_symptoms > 0:
-                # Calculate confidence based on symptom match ratio
-                match_ratio = matched_symptoms / len(rule.symptoms)
-                confidence = rule.confidence * match_ratio
-                matches.append((rule, confidence))
-                
-        # Sort by confidence and priority
-        matches.sort(key=lambda x: (x[1], x[0].priority), reverse=True)
-        return matches[:5] # Return top 5 matches
+        for rule_id, matched_symptoms in matched.items():
+            rule = data.rules[rule_id]
+            # Calculate confidence based on symptom match ratio
+            match_ratio = matched_symptoms / len(rule.symptoms)
+            confidence = rule.confidence * match_ratio
+            matches.append((rule, confidence))
+            
+        # Sort by confidence and priority; ties keep rule order
+        return heapq.nlargest(5, matches, key=lambda x: (x[1], x[0].priority, -data.rule_order[x[0].rule_id]))
+    
+    def diagnose_bayes(self, selected_symptoms: List[str]) -> List[tuple]:
+        """Return list of (rule, posterior_probability) tuples from the naive Bayes model"""
+        data = self.data_manager
+        symptoms = [data.normalize_symptom(symptom) for symptom in selected_symptoms]
+        return [(data.rules[rule_id], probability) for rule_id, probability in data.bayes.predict(symptoms)]
+    
+    def similar_cases(self, selected_symptoms: List[str], k: int = 5, resolved_only: bool = True) -> List[tuple]:
+        """Return list of (case, jaccard_similarity) tuples for the most similar saved cases"""
+        data = self.data_manager
+        symptoms = [data.normalize_symptom(symptom) for symptom in selected_symptoms]
+        return [(data.cases[case_id], similarity)
+                for case_id, similarity in data.case_index.search(symptoms, k, resolved_only)]
     
 class RuleDialog(QDialog):
     """Dialog for creating/editing rules"""
@@ -405,6 +957,38 @@ class RuleDialog(QDialog):
             self.confidence_spin.value() / 100.0
         )   
         
+class SaveCaseDialog(QDialog):
+    """Dialog for confirming which rule resolved a case before it is saved"""
+    def __init__(self, parent=None, rules: List[TroubleshootingRule] = None, suggested_rule_id: Optional[str] = None):
+        super().__init__(parent)
+        self.setWindowTitle("Save Case")
+        self.setModal(True)
+        
+        layout = QVBoxLayout()
+        layout.addWidget(QLabel("Which rule resolved this problem?"))
+        self.rule_combo = QComboBox()
+        self.rule_combo.addItem("Not resolved yet", None)
+        for rule in rules or []:
+            self.rule_combo.addItem(f"{rule.rule_id} - {rule.title}", rule.rule_id)
+        index = self.rule_combo.findData(suggested_rule_id)
+        if suggested_rule_id and index >= 0:
+            self.rule_combo.setCurrentIndex(index)
+        layout.addWidget(self.rule_combo)
+        
+        # buttons
+        button_layout = QHBoxLayout()
+        save_btn = QPushButton("Save")
+        cancel_btn = QPushButton("Cancel")
+        save_btn.clicked.connect(self.accept)
+        cancel_btn.clicked.connect(self.reject)
+        button_layout.addWidget(save_btn)
+        button_layout.addWidget(cancel_btn)
+        layout.addLayout(button_layout)
+        self.setLayout(layout)
+        
+    def get_rule_id(self) -> Optional[str]:
+        return self.rule_combo.currentData()
+    
 class ExpertSystemApp(QMainWindow):
     """Main application window"""
     def __init__(self):
@@ -461,6 +1045,15 @@ class ExpertSystemApp(QMainWindow):
         self.symptoms_area.setMaximumHeight(200)
         layout.addWidget(self.symptoms_area)
         
+        # diagnosis mode
+        mode_layout = QHBoxLayout()
+        mode_layout.addWidget(QLabel("Diagnosis mode:"))
+        self.mode_combo = QComboBox()
+        self.mode_combo.addItems(["Rule matching", "Bayesian (learns from saved cases)"])
+        mode_layout.addWidget(self.mode_combo)
+        mode_layout.addStretch()
+        layout.addLayout(mode_layout)
+        
         # diagnose button
         diagnose_btn = QPushButton("Diagnose Problem")
         diagnose_btn.clicked.connect(self.run_diagnosis)
@@ -598,20 +1191,35 @@ class ExpertSystemApp(QMainWindow):
             QMessageBox.warning(self, "Warning", "Please selected at least one symptom.")
             return
         
-        matches = self.inference_engine.diagnose(selected_symptoms)
+        bayesian = self.mode_combo.currentIndex() == 1
+        if bayesian:
+            matches = self.inference_engine.diagnose_bayes(selected_symptoms)
+        else:
+            matches = self.inference_engine.diagnose(selected_symptoms)
+        score_label = "Probability" if bayesian else "Confidence"
         
         if matches:
             results_text = "Based on the symptoms, here are the most likely problems:\n\n"
             for i, (rule, confidence) in enumerate(matches, 1):
-                results_text += f"{i}. {rule.title} (Confidence: {confidence:.0%})\n"
+                results_text += f"{i}. {rule.title} ({score_label}: {confidence:.0%})\n"
                 results_text += f"  Category: {rule.category}\n"
                 results_text += f"  Solution:\n{rule.solution}\n\n"
         else:
             results_text = "No matching problems found. Please check if you've selected the correct symptoms or contact technical support."
+            
+        similar_cases = self.inference_engine.similar_cases(selected_symptoms, 3)
+        if similar_cases:
+            results_text += "\n\nSimilar resolved cases:\n"
+            for case, similarity in similar_cases:
+                rule = self.data_manager.read_rule(case.rule_id)
+                title = rule.title if rule else case.rule_id
+                results_text += f"- {case.case_id} ({case.created_date[:10]}, {similarity:.0%} similar): {title}\n"
         
         self.results_text.setPlainText(results_text)
         self.current_diagnosis = results_text
         self.current_symptoms = selected_symptoms
+        # suggested when saving; the case only teaches the Bayesian mode once the user confirms it
+        self.current_rule_id = matches[0][0].rule_id if matches else None
         
     def add_rule(self):
         """Add a new rule"""
@@ -652,8 +1260,13 @@ class ExpertSystemApp(QMainWindow):
     def save_current_case(self):
         """save current diagnosis as a case"""
         if hasattr(self, 'current_symptoms') and hasattr(self, 'current_diagnosis'):
+            dialog = SaveCaseDialog(self, self.data_manager.read_all_rules(), self.current_rule_id)
+            if dialog.exec() != QDialog.DialogCode.Accepted:
+                return
+            rule_id = dialog.get_rule_id()
             case_id = f"CASE_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
-            case = TroubleshootingCase(case_id, self.current_symptoms, self.current_diagnosis)
+            case = TroubleshootingCase(case_id, self.current_symptoms, self.current_diagnosis,
+                                       rule_id=rule_id, confirmed=rule_id is not None)
             self.data_manager.create_case(case)
             self.laod_cases_table()
             QMessageBox.information(self, "Success", f"Case saved as {case_id}")
@@ -671,6 +1284,143 @@ class ExpertSystemApp(QMainWindow):
                 self.laod_cases_table()
                 QMessageBox.information(self, "Success", "Case deleted successfully!")
                 
+# Headless batch diagnosis
+_batch_engine = None
+_batch_mode = "rules"
+
+def _init_batch_worker(filename: str, db_path: Optional[str], mode: str):
+    """Load the rule base once per worker process."""
+    global _batch_engine, _batch_mode
+    _batch_engine = InferenceEngine(DataManager(filename, db_path))
+    _batch_mode = mode
+    
+def _diagnose_tickets(tickets: List[tuple]) -> List[Dict[str, Any]]:
+    """Diagnose a chunk of (line_number, ticket) pairs in a worker process."""
+    results = []
+    for line_number, ticket in tickets:
+        if isinstance(ticket, str):
+            results.append({"line": line_number, "error": ticket})
+            continue
+        if not isinstance(ticket, dict) or not isinstance(ticket.get("symptoms"), list):
+            results.append({"line": line_number, "error": "expected an object with a 'symptoms' list"})
+            continue
+        symptoms = [str(symptom) for symptom in ticket["symptoms"]]
+        if _batch_mode == "bayes":
+            matches = _batch_engine.diagnose_bayes(symptoms)
+        else:
+            matches = _batch_engine.diagnose(symptoms)
+        results.append({
+            "ticket_id": ticket.get("ticket_id", ticket.get("id", line_number)),
+            "results": [{"rank": rank, "rule_id": rule.rule_id, "title": rule.title,
+                         "category": rule.category, "score": round(score, 6)}
+                        for rank, (rule, score) in enumerate(matches, 1)]
+        })
+    return results
+
+def diagnose_batch(tickets, filename: str = "expert_system_data.json", db_path: Optional[str] = None,
+                   workers: Optional[int] = None, mode: str = "rules", chunksize: int = 256):
+    """Diagnose an iterable of (line_number, ticket) pairs in a process pool and yield one result
+    dict per ticket, in input order.
+
+    Tickets are dicts with a "symptoms" list and an optional "ticket_id". Each worker loads the
+    rule base once; tickets are sent in chunks and only a few chunks per worker are in flight,
+    so memory stays flat however long the input is.
+    """
+    if mode not in ("rules", "bayes"):
+        raise ValueError(f"Unknown diagnosis mode {mode!r}")
+    # create or migrate the database once here, so workers only ever read it
+    DataManager(filename, db_path).close()
+    workers = workers or os.cpu_count() or 1
+    with ProcessPoolExecutor(workers, initializer=_init_batch_worker,
+                             initargs=(filename, db_path, mode)) as executor:
+        pending = deque()
+        chunk = []
+        for item in tickets:
+            chunk.append(item)
+            if len(chunk) == chunksize:
+                pending.append(executor.submit(_diagnose_tickets, chunk))
+                chunk = []
+                while len(pending) >= workers * 4:
+                    yield from pending.popleft().result()
+        if chunk:
+            pending.append(executor.submit(_diagnose_tickets, chunk))
+        while pending:
+            yield from pending.popleft().result()
+            
+def read_tickets(path: str):
+    """Yield (line_number, ticket) from a JSON Lines file, skipping blank lines; a line that is
+    not valid JSON is yielded as an error message string instead of a ticket."""
+    with open(path, 'r', encoding='utf-8') as f:
+        for line_number, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            try:
+                yield line_number, json.loads(line)
+            except json.JSONDecodeError as e:
+                yield line_number, f"invalid JSON: {e}"
+                
+def run_batch(input_path: str, output_path: str, **options) -> Dict[str, Any]:
+    """Diagnose every ticket in a JSONL file, write ranked results as JSONL and return run stats."""
+    start = time.perf_counter()
+    count = errors = 0
+    with open(output_path, 'w', encoding='utf-8') as out:
+        for result in diagnose_batch(read_tickets(input_path), **options):
+            out.write(json.dumps(result, ensure_ascii=False) + "\n")
+            count += 1
+            errors += "error" in result
+    seconds = time.perf_counter() - start
+    return {"tickets": count, "errors": errors, "seconds": seconds,
+            "per_second": count / seconds if seconds else 0.0}
+
+def benchmark_batch(rule_counts=(100, 1000, 10000), tickets: int = 20000, workers: Optional[int] = None):
+    """Report batch throughput (diagnoses/sec) against rule base size."""
+    import random
+    import tempfile
+    
+    rng = random.Random(0)
+    workers = workers or os.cpu_count() or 1
+    print(f"{tickets} tickets, {workers} worker(s)")
+    for rule_count in rule_counts:
+        with tempfile.TemporaryDirectory() as tmp:
+            filename = os.path.join(tmp, "benchmark.json")
+            vocabulary = [f"symptom {index:05d}" for index in range(max(50, rule_count // 2))]
+            data = DataManager(filename)
+            for rule_id in list(data.rules):
+                data.delete_rule(rule_id) # drop the sample rules
+            for index in range(rule_count):
+                rule = TroubleshootingRule(f"R{index:05d}", f"Problem {index}", "", rng.sample(vocabulary, 4),
+                                           "", "Benchmark", rng.randint(1, 3), rng.uniform(0.5, 1.0))
+                data.rules[rule.rule_id] = rule
+                data._index_rule(rule)
+            data.save_data()
+            data.close()
+            
+            input_path = os.path.join(tmp, "tickets.jsonl")
+            with open(input_path, 'w', encoding='utf-8') as f:
+                for index in range(tickets):
+                    f.write(json.dumps({"ticket_id": index, "symptoms": rng.sample(vocabulary, 3)}) + "\n")
+            for mode in ("rules", "bayes"):
+                stats = run_batch(input_path, os.path.join(tmp, "results.jsonl"),
+                                  filename=filename, workers=workers, mode=mode)
+                print(f"{rule_count:>6} rules, {mode:<5}: {stats['per_second']:,.0f} diagnoses/sec "
+                      f"({stats['seconds']:.2f}s)")
+                
+def batch_main(argv: List[str]):
+    parser = argparse.ArgumentParser(description="Diagnose tickets without the GUI.")
+    parser.add_argument("--batch", nargs=2, metavar=("TICKETS_JSONL", "RESULTS_JSONL"),
+                        help="diagnose every ticket in TICKETS_JSONL and write ranked results")
+    parser.add_argument("--benchmark", action="store_true", help="report throughput against rule count")
+    parser.add_argument("--data", default="expert_system_data.json", help="rule base (JSON name; the .db beside it is used)")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: CPU count)")
+    parser.add_argument("--mode", choices=("rules", "bayes"), default="rules")
+    args = parser.parse_args(argv)
+    if args.benchmark:
+        benchmark_batch(workers=args.workers)
+    if args.batch:
+        stats = run_batch(args.batch[0], args.batch[1], filename=args.data, workers=args.workers, mode=args.mode)
+        print(f"Diagnosed {stats['tickets']} tickets ({stats['errors']} errors) in {stats['seconds']:.2f}s, "
+              f"{stats['per_second']:,.0f}/sec")
+        
 def main():
     app = QApplication(sys.argv)
     app.setApplicationName("Computer Troubleshooting Expert System")
@@ -681,4 +1431,7 @@ def main():
     sys.exit(app.exec())
     
 if __name__ == "__main__":
-    main()
+    if "--batch" in sys.argv or "--benchmark" in sys.argv:
+        batch_main(sys.argv[1:])
+    else:
+        main()
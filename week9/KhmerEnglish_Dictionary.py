@@ -1,5 +1,8 @@
 import sys
+import re
 import sqlite3
+import threading
+from contextlib import contextmanager
 from PyQt6.QtWidgets import (QApplication, QMainWindow, QVBoxLayout, QHBoxLayout,
                              QWidget, QLabel, QLineEdit, QPushButton, QTextEdit,
                              QTableView, QMessageBox, QHeaderView, QFrame, 
@@ -148,177 +151,291 @@ class DictionaryTableModel(QAbstractTableModel):
             return True
         return False
         
+class ConnectionPool:
+    """Keep one long-lived SQLite connection per thread"""
+    
+    def __init__(self, db_path, cached_statements=128):
+        self.db_path = db_path
+        self.cached_statements = cached_statements
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._connections = []
+        
+    def get_connection(self):
+        """Return the calling thread's connection, opening it on first use"""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            # sqlite3 caches prepared statements per connection, so keeping it open lets
+            # repeated queries skip re-parsing; WAL lets readers run alongside a writer
+            conn = sqlite3.connect(self.db_path, cached_statements=self.cached_statements,
+                                   check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+            with self._lock:
+                self._connections.append(conn)
+        return conn
+    
+    @contextmanager
+    def transaction(self):
+        """Yield the thread's connection, committing on success and rolling back on error"""
+        conn = self.get_connection()
+        try:
+            yield conn
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        
+    def close_all(self):
+        """Close every connection handed out by the pool"""
+        with self._lock:
+            for conn in self._connections:
+                conn.close()
+            self._connections.clear()
+        self._local = threading.local()
+        
 class DictionaryDatabase:
     """Manage the SQLite database for dictionary operations"""
     
     def __init__(self, db_path="khmer_english_dictionary.db"):
         self.db_path = db_path
+        self.pool = ConnectionPool(db_path)
+        self.fts_enabled = False
         self.init_database()
         
+    def close(self):
+        """Close all pooled connections"""
+        self.pool.close_all()
+        
     def init_database(self):
         """Initialize the SQLite database with required tables"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS dictionary(
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                english_word TEXT NOT NULL UNIQUE,
-                khmer_word TEXT NOT NULL,
-                word_type TEXT DEFAULT 'noun',
-                definition TEXT,
-                example_sentence TEXT,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        ''') 
-        
-        cursor.execute("SELECT COUNT(*) FROM dictionary")
-        if cursor.fetchone()[0] == 0:
-            sample_data = [
-                ("hello", "សួស្ដី", "greeting", "A greeting used when meeting someone", "Hello, how are you?"),
-                ("goodbye", "លាហើយ", "greeting", "A farewell expression", "Goodbye, see you tomorrow!"),
-                ("thank you", "អរគុណ", "expression", "Expression of gratitude", "Thank you for your help"),
-                ("please", "សូម", "adverb", "Used to make a polite request", "Please help me"),
-                ("yes", "បាទ/ចាស", "response", "Affirmative response", "Yes, I agree"),
-                ("no", "ទេ", "response", "Negative response", "No, I don't want to"),
-                ("water", "ទឹក", "noun", "Clear liquid essential for life", "I want to drink a cup of water"),
-                ("food", "អាហារ", "noun", "Substance consumed for nutrition","The food is delicious"),
-                ("house", "ផ្ទះ", "noun", "A building for living", "This is my house"),
-                ("school", "សាលា", "noun", "Institution for education", "I go to school every day"),
-                ("book", "សៀវភៅ", "noun", "Written or printed work", "I am reading a book"),
-                ("student", "សិស្ស", "noun", "Person who studies", "She is a good student")
-            ]
-        
-            cursor.executemany('''
-                INSERT INTO dictionary (english_word, khmer_word, word_type, definition, example_sentence)
-                VALUES(?, ?, ?, ?, ?)
-                ''', sample_data)
-        
-        conn.commit()
-        conn.close()
+        with self.pool.transaction() as conn:
+            cursor = conn.cursor()
+            
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS dictionary(
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    english_word TEXT NOT NULL UNIQUE,
+                    khmer_word TEXT NOT NULL,
+                    word_type TEXT DEFAULT 'noun',
+                    definition TEXT,
+                    example_sentence TEXT,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
+            ''') 
+            
+            self._init_search_index(cursor)
+            
+            cursor.execute("SELECT COUNT(*) FROM dictionary")
+            if cursor.fetchone()[0] == 0:
+                sample_data = [
+                    ("hello", "សួស្ដី", "greeting", "A greeting used when meeting someone", "Hello, how are you?"),
+                    ("goodbye", "លាហើយ", "greeting", "A farewell expression", "Goodbye, see you tomorrow!"),
+                    ("thank you", "អរគុណ", "expression", "Expression of gratitude", "Thank you for your help"),
+                    ("please", "សូម", "adverb", "Used to make a polite request", "Please help me"),
+                    ("yes", "បាទ/ចាស", "response", "Affirmative response", "Yes, I agree"),
+                    ("no", "ទេ", "response", "Negative response", "No, I don't want to"),
+                    ("water", "ទឹក", "noun", "Clear liquid essential for life", "I want to drink a cup of water"),
+                    ("food", "អាហារ", "noun", "Substance consumed for nutrition","The food is delicious"),
+                    ("house", "ផ្ទះ", "noun", "A building for living", "This is my house"),
+                    ("school", "សាលា", "noun", "Institution for education", "I go to school every day"),
+                    ("book", "សៀវភៅ", "noun", "Written or printed work", "I am reading a book"),
+                    ("student", "សិស្ស", "noun", "Person who studies", "She is a good student")
+                ]
+            
+                cursor.executemany('''
+                    INSERT INTO dictionary (english_word, khmer_word, word_type, definition, example_sentence)
+                    VALUES(?, ?, ?, ?, ?)
+                    ''', sample_data)
+        
+    # columns mirrored into the FTS index: headwords for read_word, plus type and
+    # definition so filter_words can match all four in one index lookup
+    FTS_COLUMNS = ("english_word", "khmer_word", "word_type", "definition")
+    
+    def _init_search_index(self, cursor):
+        """Create the FTS5 trigram index over the dictionary, kept in sync by triggers"""
+        columns = ", ".join(self.FTS_COLUMNS)
+        old_values = ", ".join(f"old.{column}" for column in self.FTS_COLUMNS)
+        new_values = ", ".join(f"new.{column}" for column in self.FTS_COLUMNS)
+        
+        cursor.execute("SELECT 1 FROM sqlite_master WHERE name = 'dictionary_fts'")
+        existed = cursor.fetchone() is not None
+        if existed:
+            indexed = tuple(row[1] for row in cursor.execute("PRAGMA table_info(dictionary_fts)"))
+            if indexed != self.FTS_COLUMNS:
+                # index built with a different column set - recreate it
+                for trigger in ("insert", "delete", "update"):
+                    cursor.execute(f"DROP TRIGGER IF EXISTS dictionary_fts_{trigger}")
+                cursor.execute("DROP TABLE dictionary_fts")
+                existed = False
+        try:
+            # trigram tokenizer because Khmer has no spaces between words
+            cursor.execute(f'''
+                CREATE VIRTUAL TABLE IF NOT EXISTS dictionary_fts USING fts5(
+                    {columns},
+                    content='dictionary', content_rowid='id', tokenize='trigram'
+                )
+            ''')
+        except sqlite3.OperationalError:
+            # SQLite without FTS5 or older than 3.34 - keep searching with LIKE
+            self.fts_enabled = False
+            return
+        
+        cursor.execute(f'''
+            CREATE TRIGGER IF NOT EXISTS dictionary_fts_insert AFTER INSERT ON dictionary BEGIN
+                INSERT INTO dictionary_fts(rowid, {columns}) VALUES (new.id, {new_values});
+            END
+        ''')
+        cursor.execute(f'''
+            CREATE TRIGGER IF NOT EXISTS dictionary_fts_delete AFTER DELETE ON dictionary BEGIN
+                INSERT INTO dictionary_fts(dictionary_fts, rowid, {columns}) VALUES ('delete', old.id, {old_values});
+            END
+        ''')
+        cursor.execute(f'''
+            CREATE TRIGGER IF NOT EXISTS dictionary_fts_update AFTER UPDATE OF {columns} ON dictionary BEGIN
+                INSERT INTO dictionary_fts(dictionary_fts, rowid, {columns}) VALUES ('delete', old.id, {old_values});
+                INSERT INTO dictionary_fts(rowid, {columns}) VALUES (new.id, {new_values});
+            END
+        ''')
+        if not existed:
+            # index rows written before the FTS table existed
+            cursor.execute("INSERT INTO dictionary_fts(dictionary_fts) VALUES ('rebuild')")
+        self.fts_enabled = True
+        
+    @staticmethod
+    def _fts_phrase(column, term):
+        """Quote a search term as an FTS5 phrase, restricted to one column unless column is None"""
+        phrase = f'"{term.replace(chr(34), chr(34) * 2)}"'
+        return phrase if column is None else f"{column} : {phrase}"
         
     def create_word(self, english_word, khmer_word, word_type="noun", definition="", example=""):
         """Create operation - Add new word to dictionary"""
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            cursor.execute('''
-                INSERT INTO dictionary (english_word, khmer_word, word_type, definition, example_sentence)
-                VALUES(?,?,?,?,?)         
-            ''', (english_word.lower().strip(), khmer_word.strip(), word_type, definition, example))
-            conn.commit()
-            word_id = cursor.lastrowid
-            conn.close()
-            return word_id
+            with self.pool.transaction() as conn:
+                cursor = conn.execute('''
+                    INSERT INTO dictionary (english_word, khmer_word, word_type, definition, example_sentence)
+                    VALUES(?,?,?,?,?)         
+                ''', (english_word.lower().strip(), khmer_word.strip(), word_type, definition, example))
+            return cursor.lastrowid
         except sqlite3.IntegrityError:
-            conn.close()
             raise ValueError(f"Word '{english_word}' already exists in dictionary")
         except Exception as e:
-            conn.close()
             raise ValueError(f"Database error: {str(e)}")
         
     def read_word(self, search_term, search_type="english"):
         """READ operation - Searching for words"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
         try:
-            if search_type == "english":
-                cursor.execute('''
+            conn = self.pool.get_connection()
+            # trigrams need at least 3 characters; shorter terms fall back to LIKE
+            column = "english_word" if search_type == "english" else "khmer_word"
+            term = search_term.lower() if search_type == "english" else search_term
+            if self.fts_enabled and len(term) >= 3:
+                cursor = conn.execute(f'''
+                    SELECT dictionary.* FROM dictionary_fts
+                    JOIN dictionary ON dictionary.id = dictionary_fts.rowid
+                    WHERE dictionary_fts MATCH ?
+                    ORDER BY dictionary.{column} = ? DESC, bm25(dictionary_fts), dictionary.{column}
+                ''', (self._fts_phrase(column, term), term))
+            elif search_type == "english":
+                cursor = conn.execute('''
                     SELECT * FROM dictionary
                     WHERE english_word LIKE ? OR english_word = ?
                     ORDER BY english_word       
                 ''', (f"%{search_term.lower()}%", search_term.lower()))
             else:
-                cursor.execute('''
+                cursor = conn.execute('''
                     SELECT * FROM dictionary
                     WHERE khmer_word LIKE ?
                     ORDER BY khmer_word
                 ''', (f"%{search_term}%",))
-            
-            results = cursor.fetchall()
-            conn.close()
-            return results
+            return cursor.fetchall()
         except Exception as e:
-            conn.close()
             return []
         
     def read_all_words(self):
         """READ operation - Get all words"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
         try:
-            cursor.execute("SELECT * FROM dictionary ORDER BY english_word")
-            results = cursor.fetchall()
-            conn.close()
-            return results
+            cursor = self.pool.get_connection().execute("SELECT * FROM dictionary ORDER BY english_word")
+            return cursor.fetchall()
+        except Exception as e:
+            return []
+        
+    def filter_words(self, filter_text):
+        """READ operation - Words whose headwords, type or definition contain filter_text"""
+        try:
+            conn = self.pool.get_connection()
+            if self.fts_enabled and len(filter_text) >= 3:
+                cursor = conn.execute('''
+                    SELECT * FROM dictionary
+                    WHERE id IN (SELECT rowid FROM dictionary_fts WHERE dictionary_fts MATCH ?)
+                    ORDER BY english_word
+                ''', (self._fts_phrase(None, filter_text),))
+            else:
+                # trigrams need at least 3 characters; escape LIKE wildcards typed by the user
+                pattern = "%" + re.sub(r"([\\%_])", r"\\\1", filter_text) + "%"
+                cursor = conn.execute('''
+                    SELECT * FROM dictionary
+                    WHERE english_word LIKE ? ESCAPE '\\' OR khmer_word LIKE ? ESCAPE '\\'
+                       OR word_type LIKE ? ESCAPE '\\' OR definition LIKE ? ESCAPE '\\'
+                    ORDER BY english_word
+                ''', (pattern, pattern, pattern, pattern))
+            return cursor.fetchall()
         except Exception as e:
-            conn.close()
             return []
         
+    def count_words(self):
+        """Return the number of dictionary entries"""
+        try:
+            return self.pool.get_connection().execute("SELECT COUNT(*) FROM dictionary").fetchone()[0]
+        except Exception as e:
+            return 0
+        
     def update_word(self, word_id, english_word=None, khmer_word=None, word_type=None, definition=None, example=None):
         """Update operation - Modify existing word"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        updates = []
+        params = []
+        if english_word is not None:
+            updates.append("english_word = ?")
+            params.append(english_word.lower().strip())
+        if khmer_word is not None:
+            updates.append("khmer_word = ?")
+            params.append(khmer_word.strip())
+        if word_type is not None:
+            updates.append("word_type = ?")
+            params.append(word_type)
+        if definition is not None:
+            updates.append("definition = ?")
+            params.append(definition)  
+        if example is not None:
+            updates.append("example_sentence = ?")
+            params.append(example)
+        updates.append("updated_at = CURRENT_TIMESTAMP")
+        params.append(word_id)
         try:
-            updates = []
-            params = []
-            if english_word is not None:
-                updates.append("english_word = ?")
-                params.append(english_word.lower().strip())
-            if khmer_word is not None:
-                updates.append("khmer_word = ?")
-                params.append(khmer_word.strip())
-            if word_type is not None:
-                updates.append("word_type = ?")
-                params.append(word_type)
-            if definition is not None:
-                updates.append("definition = ?")
-                params.append(definition)  
-            if example is not None:
-                updates.append("example_sentence = ?")
-                params.append(example)
-            updates.append("updated_at = CURRENT_TIMESTAMP")
-            params.append(word_id)
-            if updates:
-                query = f"UPDATE dictionary SET {', '.join(updates)} WHERE id = ?"
-                cursor.execute(query, params)
-                affected_rows = cursor.rowcount
-                conn.commit()
-                conn.close()
-                return affected_rows > 0
-            conn.close()
-            return False
+            query = f"UPDATE dictionary SET {', '.join(updates)} WHERE id = ?"
+            with self.pool.transaction() as conn:
+                cursor = conn.execute(query, params)
+            return cursor.rowcount > 0
         except Exception as e:
-            conn.close()
             raise ValueError(f"Update error: {str(e)}")
     
     def delete_word(self, word_id):
         """DELETE operation - Remove word from dictionary"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
         try:
-            cursor.execute("DELETE FROM dictionary WHERE id = ?", (word_id,))
-            affected_rows = cursor.rowcount
-            conn.commit()
-            conn.close()
-            return affected_rows > 0
+            with self.pool.transaction() as conn:
+                cursor = conn.execute("DELETE FROM dictionary WHERE id = ?", (word_id,))
+            return cursor.rowcount > 0
         except Exception as e:
-            conn.close()
             raise ValueError(f"Delete error: {str(e)}")
         
     def get_random_words(self, limit=5):
         """Get random words for display"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
         try:
-            cursor.execute("SELECT * FROM dictionary ORDER BY RANDOM() LIMIT ?", (limit,))
-            results = cursor.fetchall()
-            conn.close()
-            return results
+            cursor = self.pool.get_connection().execute("SELECT * FROM dictionary ORDER BY RANDOM() LIMIT ?", (limit,))
+            return cursor.fetchall()
         except Exception as e:
-            conn.close()
             return []
         
 class WordDetailsDialog(QDialog):
@@ -830,8 +947,6 @@ class DictionaryManagerWidget(QWidget):
             return
     
         try:
-            conn = sqlite3.connect(self.db.db_path)
-            cursor = conn.cursor()
             updates = []
             params = []
             if english:
@@ -854,10 +969,8 @@ class DictionaryManagerWidget(QWidget):
         
             if updates:
                 query = f"UPDATE dictionary SET {', '.join(updates)} WHERE id = ?"
-                cursor.execute(query, params)
-                affected_rows = cursor.rowcount
-                conn.commit()
-                conn.close()
+                with self.db.pool.transaction() as conn:
+                    affected_rows = conn.execute(query, params).rowcount
             
                 if affected_rows > 0:
                     self.cancel_edit()
@@ -897,9 +1010,6 @@ class DictionaryManagerWidget(QWidget):
                 f"Failed to update word: {str(e)}"
             )
             msg.exec()
-        finally:
-            if 'conn' in locals():
-                conn.close()
             
     def edit_selected_word(self):
         """Prepare UPDATE operation - Load selected word into form for editing"""
@@ -959,12 +1069,8 @@ class DictionaryManagerWidget(QWidget):
             )
             if msg.exec() == QMessageBox.StandardButton.Yes:
                 try:
-                    conn = sqlite3.connect(self.db.db_path)
-                    cursor = conn.cursor()
-                    cursor.execute("DELETE FROM dictionary WHERE id = ?", (word_id,))
-                    affected_rows = cursor.rowcount
-                    conn.commit()
-                    conn.close()
+                    with self.db.pool.transaction() as conn:
+                        affected_rows = conn.execute("DELETE FROM dictionary WHERE id = ?", (word_id,)).rowcount
                 
                     if affected_rows > 0:
                         self.refresh_dictionary()
@@ -1004,19 +1110,10 @@ class DictionaryManagerWidget(QWidget):
             self.refresh_dictionary()
             return
         
-        words = self.db.read_all_words()
-        filtered_words = []
-        
-        for word in words:
-            word_id, english, khmer, word_type, definition, example, created, updated = word
-            if (filter_text in english.lower() or 
-                filter_text in khmer or 
-                filter_text in word_type.lower() or
-                filter_text in (definition or "").lower()):
-                filtered_words.append(word) 
-                
+        # matching happens in SQLite instead of looping over every row in Python
+        filtered_words = self.db.filter_words(filter_text)
         self.table_model.update_data(filtered_words)
-        self.stats_label.setText(f"Showing {len(filtered_words)} of {len(words)} entries")
+        self.stats_label.setText(f"Showing {len(filtered_words)} of {self.db.count_words()} entries")
     
     def cancel_edit(self):
         """Cancel edit mode and return to create mode"""
@@ -1275,6 +1372,11 @@ class KhmerEnglishDictionaryApp(QMainWindow):
         self.manager_tab.word_deleted.connect(
             lambda word_id: self.statusBar().showMessage(f"✔️ Deleted word ID: {word_id}")
         )
+        
+    def closeEvent(self, event):
+        """Close pooled database connections when the application closes"""
+        self.db.close()
+        event.accept()
     
 def main():
     app = QApplication(sys.argv)